@@ -0,0 +1,102 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_refinery
+
+import hashlib
+import sqlite3
+from typing import List, Optional
+
+import numpy as np
+
+from coreason_refinery.models import RefinedChunk
+
+
+class ChunkEmbeddingCache:
+    """Content-addressed cache for chunk embedding vectors.
+
+    Keys are a BLAKE2b digest of the chunk text, so a re-ingest of an
+    unchanged document resolves every vector from the cache and skips
+    the embedding model entirely. Backed by sqlite: pass a file path for
+    persistence across runs, or keep the in-memory default for
+    per-process caching.
+
+    Vectors are stored symmetrically quantized to int8 with a per-vector
+    scale — a quarter of the FP32 footprint at negligible similarity
+    loss — and dequantized to floats on load.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Initialize the cache.
+
+        Args:
+            path: sqlite database path. Defaults to ":memory:"
+                (process-local, not persisted).
+        """
+        # The pipeline embeds from worker threads; sqlite's same-thread
+        # guard would reject that even though access is serialized.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, scale REAL NOT NULL, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(chunk: RefinedChunk) -> str:
+        """Compute the cache key for a chunk.
+
+        Args:
+            chunk: The chunk whose text identifies the embedding.
+
+        Returns:
+            Hex digest of the chunk text (BLAKE2b, 16 bytes).
+        """
+        return hashlib.blake2b(chunk.text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Look up a stored vector.
+
+        Args:
+            key: Cache key as returned by key_for.
+
+        Returns:
+            The stored vector (dequantized), or None on a cache miss.
+        """
+        row = self._conn.execute("SELECT scale, vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        scale, blob = row
+        quantized = np.frombuffer(blob, dtype=np.int8)
+        return (quantized.astype(np.float32) * scale).tolist()  # type: ignore[no-any-return]
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """Store a vector under the given key.
+
+        The vector is quantized to int8 with a symmetric per-vector
+        scale; retrieval through get() is therefore approximate, within
+        quantization tolerance.
+
+        Args:
+            key: Cache key as returned by key_for.
+            vector: The embedding vector to store.
+        """
+        values = np.asarray(vector, dtype=np.float32)
+        peak = float(np.abs(values).max()) if values.size else 0.0
+        # Zero vectors quantize to zeros under any scale; 1.0 avoids a
+        # division by zero.
+        scale = peak / 127 if peak else 1.0
+        quantized = np.round(values / scale).astype(np.int8)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO embeddings (key, scale, vector) VALUES (?, ?, ?)",
+            (key, scale, quantized.tobytes()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying sqlite connection."""
+        self._conn.close()
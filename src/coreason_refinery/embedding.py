@@ -0,0 +1,47 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_refinery
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class Embedder(ABC):
+    """Abstract base class for the embedding stage (The Vectorizer).
+
+    Concrete implementations wrap an embedding model or API. The
+    pipeline only embeds when an Embedder is injected; without one,
+    chunks keep their deferred empty vectors.
+    """
+
+    @abstractmethod
+    def embed(self, text: str) -> List[float]:
+        """Embed a single chunk text.
+
+        Args:
+            text: The chunk text to embed.
+
+        Returns:
+            The embedding vector for the text.
+        """
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts in one call.
+
+        The default falls back to per-text embed; implementations backed
+        by a batch API or GPU model should override it, since the
+        pipeline funnels all cache misses of a job through this method.
+
+        Args:
+            texts: The chunk texts to embed.
+
+        Returns:
+            One embedding vector per input text, in order.
+        """
+        return [self.embed(text) for text in texts]
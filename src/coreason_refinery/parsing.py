@@ -8,23 +8,61 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
+import csv
+import io
 import math
 import os
 from abc import ABC, abstractmethod
-from typing import Any, List, Literal
+from functools import lru_cache
+from typing import Any, List, Literal, Tuple
 
-import pandas as pd
+from openpyxl import load_workbook
 from pydantic import BaseModel, Field
 from unstructured.documents.elements import (
     Element,
     Footer,
     Header,
     ListItem,
+    NarrativeText,
     Table,
+    Text,
     Title,
 )
 from unstructured.partition.pdf import partition_pdf
 
+ElementType = Literal["TITLE", "NARRATIVE_TEXT", "TABLE", "LIST_ITEM", "HEADER", "FOOTER", "UNCATEGORIZED"]
+
+# Most-specific classes first; plain Text acts as the NARRATIVE_TEXT catch-all.
+_ELEMENT_TYPE_MAP: dict[type, ElementType] = {
+    Title: "TITLE",
+    Table: "TABLE",
+    ListItem: "LIST_ITEM",
+    Header: "HEADER",
+    Footer: "FOOTER",
+    NarrativeText: "NARRATIVE_TEXT",
+    Text: "NARRATIVE_TEXT",
+}
+
+
+@lru_cache(maxsize=128)
+def _resolve_type(cls: type) -> ElementType:
+    """Resolve an unstructured element class to a ParsedElement type.
+
+    Walks the MRO once per concrete class and caches the answer, so a
+    document with thousands of elements of the same type pays for the walk
+    once and then hits the cache dict in C.
+
+    Args:
+        cls: The concrete element class from unstructured.
+
+    Returns:
+        The mapped semantic type, or "UNCATEGORIZED" on an MRO miss.
+    """
+    for base in cls.__mro__:
+        if base in _ELEMENT_TYPE_MAP:
+            return _ELEMENT_TYPE_MAP[base]
+    return "UNCATEGORIZED"
+
 
 class ParsedElement(BaseModel):
     """Represents a single atomic element parsed from a source document.
@@ -40,7 +78,7 @@ class ParsedElement(BaseModel):
     """
 
     text: str
-    type: Literal["TITLE", "NARRATIVE_TEXT", "TABLE", "LIST_ITEM", "HEADER", "FOOTER", "UNCATEGORIZED"]
+    type: ElementType
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -99,30 +137,26 @@ class UnstructuredPdfParser(DocumentParser):
         Returns:
             A standardized ParsedElement.
         """
-        element_type: Literal["TITLE", "NARRATIVE_TEXT", "TABLE", "LIST_ITEM", "HEADER", "FOOTER", "UNCATEGORIZED"] = (
-            "UNCATEGORIZED"
-        )
-        if isinstance(element, Title):
-            element_type = "TITLE"
-        elif isinstance(element, Table):
-            element_type = "TABLE"
-        elif isinstance(element, ListItem):
-            element_type = "LIST_ITEM"
-        elif isinstance(element, Header):
-            element_type = "HEADER"
-        elif isinstance(element, Footer):
-            element_type = "FOOTER"
-        elif type(element).__name__ == "NarrativeText" or type(element).__name__ == "Text":
-            element_type = "NARRATIVE_TEXT"
+        element_type = _resolve_type(type(element))
 
         # Extract metadata
         metadata = element.metadata.to_dict() if element.metadata else {}
 
-        # Flatten helpful metadata fields to top level of our metadata dict
+        # Normalize JSON-hostile values (numpy scalars, Path objects) to
+        # plain ints/strs so downstream serializers like orjson can stay on
+        # their native fast path instead of falling back to default hooks.
         if "page_number" in metadata:
-            metadata["page_number"] = metadata["page_number"]
-
-        return ParsedElement(
+            metadata["page_number"] = int(metadata["page_number"])
+        if "filename" in metadata:
+            metadata["filename"] = str(metadata["filename"])
+        if "file_directory" in metadata:
+            metadata["file_directory"] = str(metadata["file_directory"])
+        if "languages" in metadata:
+            metadata["languages"] = [str(lang) for lang in metadata["languages"]]
+
+        # Values are built internally and already conform to the schema, so
+        # skip pydantic validation for each element (hot loop).
+        return ParsedElement.model_construct(
             text=str(element),
             type=element_type,
             metadata=metadata,
@@ -130,15 +164,85 @@ class UnstructuredPdfParser(DocumentParser):
 
 
 class ExcelParser(DocumentParser):
-    """Parses Excel AND CSV files into Markdown tables using pandas.
+    """Parses Excel AND CSV files into Markdown tables.
 
     Implements the 'Spreadsheet Pipeline' from the PRD.
     Treats sheets as Relational Data and converts them to Markdown Tables.
-    Handles large files by chunking row groups.
+    Streams rows directly from openpyxl (Excel) or the csv module (CSV)
+    into a Markdown pipe-table writer, avoiding intermediate DataFrame
+    construction. Handles large files by chunking row groups.
     """
 
     ROW_LIMIT = 50
 
+    @staticmethod
+    def _render_chunk(headers: List[str], rows: List[Tuple[Any, ...]]) -> str:
+        """Render a group of rows as a GitHub-style Markdown pipe table.
+
+        Cell values are stringified; pipes are escaped and embedded
+        newlines collapsed to spaces so each row stays on one line.
+
+        Args:
+            headers: Column header strings.
+            rows: Row tuples of raw cell values (None for empty cells).
+
+        Returns:
+            The Markdown table as a single string.
+        """
+        buf = io.StringIO()
+        buf.write("| " + " | ".join(headers) + " |\n")
+        buf.write("|" + "|".join("---" for _ in headers) + "|\n")
+        for row in rows:
+            buf.write(
+                "| "
+                + " | ".join("" if v is None else str(v).replace("|", r"\|").replace("\n", " ") for v in row)
+                + " |\n"
+            )
+        return buf.getvalue()
+
+    @staticmethod
+    def _read_csv(file_path: str) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Read a CSV file into a header list and data row tuples.
+
+        Args:
+            file_path: Path to the .csv file.
+
+        Returns:
+            A (headers, rows) tuple; both empty for an empty file.
+        """
+        with open(file_path, newline="") as f:
+            reader = csv.reader(f)
+            all_rows = [tuple(row) for row in reader]
+        if not all_rows:
+            return [], []
+        return [str(h) for h in all_rows[0]], all_rows[1:]
+
+    @staticmethod
+    def _read_workbook(file_path: str) -> dict[str, Tuple[List[str], List[Tuple[Any, ...]]]]:
+        """Read all sheets of an Excel workbook in streaming (read_only) mode.
+
+        Args:
+            file_path: Path to the .xlsx file.
+
+        Returns:
+            Mapping of sheet name to (headers, rows). The first row of each
+            sheet is treated as the header row.
+        """
+        sheets: dict[str, Tuple[List[str], List[Tuple[Any, ...]]]] = {}
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                row_iter = ws.iter_rows(values_only=True)
+                header_row = next(row_iter, None)
+                if header_row is None:
+                    sheets[ws.title] = ([], [])
+                    continue
+                headers = ["" if h is None else str(h) for h in header_row]
+                sheets[ws.title] = (headers, list(row_iter))
+        finally:
+            wb.close()
+        return sheets
+
     def parse(self, file_path: str) -> List[ParsedElement]:
         """Parse an Excel or CSV file.
 
@@ -151,40 +255,79 @@ class ExcelParser(DocumentParser):
         Raises:
             RuntimeError: If file reading fails.
         """
-        # Read all sheets
-        sheets = {}
-        try:
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()
+        _, ext = os.path.splitext(file_path)
+        ext = ext.lower()
 
+        # Read all sheets as (headers, rows) pairs.
+        # The try covers only the file I/O; rendering below runs outside it
+        # so the exception setup stays off the per-chunk hot path.
+        sheets: dict[str, Tuple[List[str], List[Tuple[Any, ...]]]] = {}
+        try:
             if ext == ".csv":
-                # Handle CSV specifically using read_csv
-                df = pd.read_csv(file_path)
-                # Wrap in a dictionary to mimic the multi-sheet structure of read_excel
-                sheets = {"CSV_Data": df}
+                # Wrap in a dictionary to mimic the multi-sheet structure of Excel
+                sheets = {"CSV_Data": self._read_csv(file_path)}
             else:
-                # Handle standard Excel formats (xls, xlsx, etc.)
-                # None reads all sheets as a dict of {sheet_name: df}
-                sheets = pd.read_excel(file_path, sheet_name=None)
+                # Handle standard Excel formats (xlsx etc.)
+                sheets = self._read_workbook(file_path)
         except Exception as e:
             # Handle empty or invalid files gracefully, or re-raise
             raise RuntimeError(f"Failed to parse Structured file ({file_path}): {e}") from e
 
+        # Fast path: single sheet that fits in one chunk (the overwhelmingly
+        # common case). Build the 2-element result inline and skip the
+        # chunking machinery entirely.
+        if len(sheets) == 1:
+            sheet_name, (headers, rows) = next(iter(sheets.items()))
+            if not rows:
+                return [
+                    ParsedElement.model_construct(
+                        text=f"Sheet: {sheet_name}",
+                        type="HEADER",
+                        metadata={"sheet_name": sheet_name, "section_depth": 2},
+                    ),
+                    ParsedElement.model_construct(
+                        text="(Empty Sheet)",
+                        type="NARRATIVE_TEXT",
+                        metadata={"sheet_name": sheet_name},
+                    ),
+                ]
+            if len(rows) <= self.ROW_LIMIT:
+                return [
+                    ParsedElement.model_construct(
+                        text=f"Sheet: {sheet_name}",
+                        type="HEADER",
+                        metadata={"sheet_name": sheet_name, "section_depth": 2},
+                    ),
+                    ParsedElement.model_construct(
+                        text=self._render_chunk(headers, rows),
+                        type="TABLE",
+                        metadata={
+                            "sheet_name": sheet_name,
+                            "chunk_index": 0,
+                            "total_chunks": 1,
+                            "row_start": 0,
+                            "row_end": len(rows),
+                        },
+                    ),
+                ]
+
         elements: List[ParsedElement] = []
 
-        for sheet_name, df in sheets.items():
+        # Elements are assembled from trusted, already-typed values; use
+        # model_construct to bypass pydantic validation in the hot loop.
+        for sheet_name, (headers, rows) in sheets.items():
             # Add Sheet Name as a Header
             elements.append(
-                ParsedElement(
+                ParsedElement.model_construct(
                     text=f"Sheet: {sheet_name}",
                     type="HEADER",
                     metadata={"sheet_name": sheet_name, "section_depth": 2},
                 )
             )
 
-            if df.empty:
+            if not rows:
                 elements.append(
-                    ParsedElement(
+                    ParsedElement.model_construct(
                         text="(Empty Sheet)",
                         type="NARRATIVE_TEXT",
                         metadata={"sheet_name": sheet_name},
@@ -193,33 +336,27 @@ class ExcelParser(DocumentParser):
                 continue
 
             # Calculate chunks
-            total_rows = len(df)
+            total_rows = len(rows)
             num_chunks = math.ceil(total_rows / self.ROW_LIMIT)
 
             for i in range(num_chunks):
                 start_idx = i * self.ROW_LIMIT
                 end_idx = start_idx + self.ROW_LIMIT
 
-                # Slice the dataframe
-                chunk_df = df.iloc[start_idx:end_idx]
-
-                # Convert to markdown
-                # index=False usually cleaner for data tables unless index is meaningful
-                md_table = chunk_df.to_markdown(index=False, tablefmt="github")
-
-                if md_table:
-                    elements.append(
-                        ParsedElement(
-                            text=md_table,
-                            type="TABLE",
-                            metadata={
-                                "sheet_name": sheet_name,
-                                "chunk_index": i,
-                                "total_chunks": num_chunks,
-                                "row_start": start_idx,
-                                "row_end": min(end_idx, total_rows),
-                            },
-                        )
+                md_table = self._render_chunk(headers, rows[start_idx:end_idx])
+
+                elements.append(
+                    ParsedElement.model_construct(
+                        text=md_table,
+                        type="TABLE",
+                        metadata={
+                            "sheet_name": sheet_name,
+                            "chunk_index": i,
+                            "total_chunks": num_chunks,
+                            "row_start": start_idx,
+                            "row_end": min(end_idx, total_rows),
+                        },
                     )
+                )
 
         return elements
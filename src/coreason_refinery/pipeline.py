@@ -9,20 +9,45 @@
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
 import os
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Protocol
 
 import anyio
 import httpx
 
-from coreason_refinery.models import IngestionJob, RefinedChunk
+from coreason_refinery.cache import ChunkEmbeddingCache
+from coreason_refinery.embedding import Embedder
+from coreason_refinery.models import IngestionConfig, IngestionJob, RefinedChunk
 from coreason_refinery.parsing import (
     DocumentParser,
     ExcelParser,
+    ParsedElement,
     UnstructuredPdfParser,
 )
 from coreason_refinery.segmentation import SemanticChunker
 from coreason_refinery.utils.logger import logger
 
+# Parser dispatch table: normalized file type / extension -> parser class.
+# The lambdas resolve the class at call time so tests can patch the
+# module-level class names; new formats are added here, not in code.
+_PARSER_REGISTRY: dict[str, Callable[[], type[DocumentParser]]] = {
+    "pdf": lambda: UnstructuredPdfParser,
+    "xls": lambda: ExcelParser,
+    "xlsx": lambda: ExcelParser,
+    "csv": lambda: ExcelParser,
+    "excel": lambda: ExcelParser,
+}
+
+
+class ChunkerLike(Protocol):
+    """Structural type for injected chunkers: anything with a chunk method."""
+
+    def chunk(self, elements: List[ParsedElement]) -> List[RefinedChunk]: ...
+
+
+async def _async_noop() -> None:
+    """Do nothing; stands in for aclose on externally owned clients."""
+
 
 class RefineryPipelineAsync:
     """Async Core of the Ingestion Pipeline.
@@ -30,14 +55,56 @@ class RefineryPipelineAsync:
     Handles all logic with strict lifecycle management.
     """
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        pdf_parser_cls: Optional[Callable[[], DocumentParser]] = None,
+        excel_parser_cls: Optional[Callable[[], DocumentParser]] = None,
+        chunker_cls: Optional[Callable[[IngestionConfig], ChunkerLike]] = None,
+        embedder: Optional[Embedder] = None,
+        embedding_cache: Optional[ChunkEmbeddingCache] = None,
+    ) -> None:
         """Initialize the pipeline with an optional HTTP client.
 
         Args:
             client: Optional httpx.AsyncClient for connection pooling.
+            pdf_parser_cls: Optional parser factory overriding the default
+                PDF parser (direct injection, e.g. for tests).
+            excel_parser_cls: Optional parser factory overriding the default
+                spreadsheet parser for all spreadsheet file types.
+            chunker_cls: Optional chunker factory overriding SemanticChunker.
+            embedder: Optional embedder enabling the vectorize stage.
+                Without one, chunks keep deferred empty vectors.
+            embedding_cache: Optional content-hash cache consulted before
+                the embedder. Defaults to a process-local in-memory cache
+                when an embedder is provided.
         """
         self._internal_client = client is None
         self._client = client or httpx.AsyncClient()
+        # Bind the exit action once instead of branching on ownership at
+        # every shutdown; bound here rather than __aenter__ because the
+        # sync facade tears down without entering the async context.
+        self._close = self._client.aclose if self._internal_client else _async_noop
+
+        # Injected overrides are consulted before the module registry / the
+        # default chunker; None means "use the defaults".
+        self._parser_overrides: dict[str, Callable[[], DocumentParser]] = {}
+        if pdf_parser_cls is not None:
+            self._parser_overrides["pdf"] = pdf_parser_cls
+        if excel_parser_cls is not None:
+            for file_type in ("xls", "xlsx", "csv", "excel"):
+                self._parser_overrides[file_type] = excel_parser_cls
+        self._chunker_cls = chunker_cls
+
+        # Parser instances are reused across jobs: construction is the
+        # expensive part (unstructured loads models on init), parse() is
+        # stateless. Keyed by parser class, or by factory for overrides.
+        self._parser_pool: dict[Any, DocumentParser] = {}
+
+        self._embedder = embedder
+        if embedding_cache is None and embedder is not None:
+            embedding_cache = ChunkEmbeddingCache()
+        self._embedding_cache = embedding_cache
 
     async def __aenter__(self) -> "RefineryPipelineAsync":
         return self
@@ -48,8 +115,7 @@ class RefineryPipelineAsync:
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
     ) -> None:
-        if self._internal_client:
-            await self._client.aclose()
+        await self._close()
         # Close other resources if any
 
     async def process(self, job: IngestionJob) -> List[RefinedChunk]:
@@ -82,14 +148,27 @@ class RefineryPipelineAsync:
             elements = await anyio.to_thread.run_sync(parser.parse, job.source_file_path)
             logger.info(f"Parsed {len(elements)} elements")
 
+            # Nothing to chunk: skip chunker construction entirely.
+            # Common for scan artifacts and blank pages.
+            if not elements:
+                return []
+
             # 3. Chunk Elements
-            chunker = SemanticChunker(job.config)
+            chunker_cls = self._chunker_cls if self._chunker_cls is not None else SemanticChunker
+            chunker = chunker_cls(job.config)
             logger.debug("Chunking elements")
             # Offload CPU bound chunking to a worker thread
             chunks = await anyio.to_thread.run_sync(chunker.chunk, elements)
             logger.info(f"Generated {len(chunks)} chunks")
 
-            # 4. Enrichment (Placeholder for future atomic unit)
+            # 4. Embed (Vectorize), resolving vectors through the
+            # content-hash cache so re-ingests of unchanged chunks skip
+            # the model entirely.
+            if self._embedder is not None:
+                logger.debug("Embedding chunks")
+                await anyio.to_thread.run_sync(self._embed_chunks, chunks)
+
+            # 5. Enrichment (Placeholder for future atomic unit)
             # chunks = await self._enrich(chunks)
 
             # Cast to ensure mypy knows this is a list of RefinedChunk
@@ -99,6 +178,73 @@ class RefineryPipelineAsync:
             logger.exception(f"Processing failed for job {job.id}")
             raise RuntimeError(f"Pipeline processing failed: {e}") from e
 
+    async def process_many(self, jobs: List[IngestionJob], max_concurrency: int = 8) -> List[List[RefinedChunk]]:
+        """Process multiple ingestion jobs concurrently.
+
+        Jobs run through the normal process() path, overlapped up to
+        max_concurrency at a time so parser I/O waits can interleave.
+
+        Args:
+            jobs: The ingestion jobs to process.
+            max_concurrency: Maximum number of jobs in flight at once.
+
+        Returns:
+            Per-job chunk lists, ordered by input index.
+
+        Raises:
+            RuntimeError: If any job fails.
+        """
+        semaphore = anyio.Semaphore(max_concurrency)
+        results: List[List[RefinedChunk]] = [[] for _ in jobs]
+
+        async def _process_one(index: int, job: IngestionJob) -> None:
+            async with semaphore:
+                results[index] = await self.process(job)
+
+        try:
+            async with anyio.create_task_group() as tg:
+                for index, job in enumerate(jobs):
+                    tg.start_soon(_process_one, index, job)
+        except ExceptionGroup as eg:
+            # The task group wraps child failures in an ExceptionGroup;
+            # re-raise the first one so callers see the per-job RuntimeError
+            # documented above instead of the wrapper.
+            raise eg.exceptions[0] from eg
+
+        return results
+
+    def _embed_chunks(self, chunks: List[RefinedChunk], batch_size: int = 64) -> None:
+        """Populate chunk vectors, consulting the embedding cache first.
+
+        Cache hits keep their stored vector; the misses of the whole job
+        are funneled into batched embed_batch calls rather than one call
+        per chunk, and their fresh vectors are written back for the next
+        ingest of the same content.
+
+        Args:
+            chunks: The chunks to vectorize, mutated in place.
+            batch_size: Maximum number of texts per embed_batch call.
+        """
+        assert self._embedder is not None and self._embedding_cache is not None
+
+        missing: List[tuple[str, RefinedChunk]] = []
+        for chunk in chunks:
+            key = ChunkEmbeddingCache.key_for(chunk)
+            vector = self._embedding_cache.get(key)
+            if vector is None:
+                missing.append((key, chunk))
+            else:
+                chunk.vector = vector
+
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            vectors = self._embedder.embed_batch([chunk.text for _, chunk in batch])
+            # strict: an embedder returning the wrong number of vectors must
+            # fail loudly rather than silently dropping chunks.
+            for (key, chunk), vector in zip(batch, vectors, strict=True):
+                self._embedding_cache.set(key, vector)
+                chunk.vector = vector
+
     def _get_parser(self, job: IngestionJob) -> DocumentParser:
         """Select the appropriate parser based on file type.
 
@@ -117,25 +263,34 @@ class RefineryPipelineAsync:
 
         # If file_type is generic or auto, try to deduce from extension
         if file_type == "auto":
-            _, ext = os.path.splitext(job.source_file_path)
-            ext = ext.lower().lstrip(".")
-            if ext in ["pdf"]:
-                file_type = "pdf"
-            elif ext in ["xlsx", "xls", "csv"]:
-                file_type = "xlsx"  # Treat CSV as Excel for now per PRD 3.1
-            else:
-                # Default fallback or error
-                pass
-
-        if file_type == "pdf":
-            return UnstructuredPdfParser()
-        elif file_type in ["xlsx", "excel"]:
-            return ExcelParser()
-        # elif file_type == "pptx":
-        #     return PptxParser()
-        else:
+            # rpartition avoids the normpath machinery in os.path.splitext;
+            # we only need the text after the last dot.
+            _, sep, ext = job.source_file_path.rpartition(".")
+            file_type = ext.lower() if sep else ""
+
+        # Injected overrides are instance factories; pool by the factory
+        # so repeat jobs reuse whatever it produced the first time.
+        override = self._parser_overrides.get(file_type)
+        if override is not None:
+            parser = self._parser_pool.get(override)
+            if parser is None:
+                parser = override()
+                self._parser_pool[override] = parser
+            return parser
+
+        resolver = _PARSER_REGISTRY.get(file_type)
+        if resolver is None:
             raise ValueError(f"Unsupported file type: {job.file_type}")
 
+        # Resolve the class first and pool by it, so a patched class in
+        # tests gets its own pool slot instead of a stale instance.
+        parser_cls = resolver()
+        parser = self._parser_pool.get(parser_cls)
+        if parser is None:
+            parser = parser_cls()
+            self._parser_pool[parser_cls] = parser
+        return parser
+
 
 class RefineryPipeline:
     """Sync Facade for RefineryPipelineAsync.
@@ -144,8 +299,23 @@ class RefineryPipeline:
     Wraps the Async Core using anyio.run.
     """
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
-        self._async = RefineryPipelineAsync(client=client)
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        pdf_parser_cls: Optional[Callable[[], DocumentParser]] = None,
+        excel_parser_cls: Optional[Callable[[], DocumentParser]] = None,
+        chunker_cls: Optional[Callable[[IngestionConfig], ChunkerLike]] = None,
+        embedder: Optional[Embedder] = None,
+        embedding_cache: Optional[ChunkEmbeddingCache] = None,
+    ) -> None:
+        self._async = RefineryPipelineAsync(
+            client=client,
+            pdf_parser_cls=pdf_parser_cls,
+            excel_parser_cls=excel_parser_cls,
+            chunker_cls=chunker_cls,
+            embedder=embedder,
+            embedding_cache=embedding_cache,
+        )
 
     def __enter__(self) -> "RefineryPipeline":
         return self
@@ -169,3 +339,24 @@ class RefineryPipeline:
         """
         # anyio.run is generic, cast return value
         return anyio.run(self._async.process, job)  # type: ignore[no-any-return]
+
+    def process_batch(self, jobs: List[IngestionJob], max_workers: Optional[int] = None) -> List[List[RefinedChunk]]:
+        """Process multiple ingestion jobs in parallel.
+
+        Jobs are independent per document, so they are fanned out across a
+        thread pool while each job still runs the normal Parse -> Chunk
+        sequence internally.
+
+        Args:
+            jobs: The ingestion jobs to process.
+            max_workers: Thread pool size. Defaults to the CPU count.
+
+        Returns:
+            Per-job chunk lists, ordered by input index.
+
+        Raises:
+            RuntimeError: If any job fails. Jobs already submitted still run
+                to completion before the first failure propagates.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.process, jobs))
@@ -9,12 +9,92 @@
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
 import re
+import sys
 import uuid
-from typing import Any, List, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional
 
 from coreason_refinery.models import IngestionConfig, RefinedChunk
 from coreason_refinery.parsing import ParsedElement
 
+# Header-depth pattern, compiled once at import rather than per call.
+# A single alternation covering all numbering styles, so classification
+# costs one regex walk instead of sequential probes per style. Branches,
+# tried left to right (mirroring the old probe priority):
+# - labeled: "Section 1.2.3" or "Appendix A.1"; allows alphanumeric
+#   numbering after the label, case insensitive.
+# - dotted: plain numbering like "1.2.3" or "A.1.2". At least one dot is
+#   required for an alphanumeric start so simple words like "A" don't
+#   match.
+# - bare digits without dots (e.g. "1. Introduction"), always depth 1.
+_DEPTH_RE = re.compile(
+    r"^\s*(?:"
+    r"(?:Section|Chapter|Part|Appendix)\s+(?P<labeled>[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)*)"
+    r"|(?P<dotted>[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)+)"
+    r"|\d+\.?"
+    r")",
+    re.IGNORECASE,
+)
+
+# Element types dropped by the chunker: page artifacts, not semantic
+# content. Single source of truth for the hot-loop fast path.
+_IGNORED_TYPES: frozenset[str] = frozenset({"FOOTER", "PAGE_BREAK"})
+
+# Prefix injected before extracted speaker notes (PRD 3.1)
+_NOTES_PREFIX = "Speaker Notes: "
+
+
+@lru_cache(maxsize=4096)
+def _infer_depth_cached(text: str) -> int:
+    """Infer header depth from Markdown or numbering.
+
+    Pure function of the header string; memoized because real documents
+    repeat header patterns heavily across sections and documents.
+
+    Priorities:
+    1. Markdown syntax (e.g., '##' -> 2).
+    2. Labeled sections (e.g., 'Section 1.2' -> 2).
+    3. Plain numbering (e.g., '1.2' -> 2).
+    4. Fallback to 1.
+
+    Args:
+        text: The header text to analyze.
+
+    Returns:
+        Estimated depth integer (1 being top-level under Title).
+    """
+    # 1. Markdown headers
+    # Count leading '#' (after whitespace) with plain string ops; no regex
+    # needed for a fixed-prefix check.
+    stripped = text.lstrip()
+    if stripped.startswith("#"):
+        return len(stripped) - len(stripped.lstrip("#"))
+
+    # 2. Plain numeric numbering ("1. Intro", "1.2.3 Deep"): hand-rolled
+    # digit/dot scan instead of the regex engine for the most common
+    # header shape. Only taken when the numbering token ends cleanly at
+    # whitespace/end of string; anything else (e.g. "1.Introduction")
+    # falls through to the regex patterns below.
+    if stripped and stripped[0].isdigit():
+        i = 0
+        n = len(stripped)
+        while i < n and (stripped[i].isdigit() or stripped[i] == "."):
+            i += 1
+        if i == n or stripped[i].isspace():
+            return stripped[:i].rstrip(".").count(".") + 1
+
+    # 3. Labeled or dotted numbering: one walk over the alternation.
+    match = _DEPTH_RE.match(text)
+    if match:
+        numbering = match.group("labeled") or match.group("dotted")
+        if numbering:
+            # Count dots + 1. "A" -> 1. "A.1" -> 2.
+            return numbering.count(".") + 1
+
+    # Default fallback (covers bare digit numbering, always depth 1)
+    return 1
+
 
 class SemanticChunker:
     """Chunks parsed elements based on semantic structure (headers/sections).
@@ -39,11 +119,8 @@ class SemanticChunker:
     def _infer_depth(self, text: str) -> int:
         """Infer header depth from Markdown or numbering.
 
-        Priorities:
-        1. Markdown syntax (e.g., '##' -> 2).
-        2. Labeled sections (e.g., 'Section 1.2' -> 2).
-        3. Plain numbering (e.g., '1.2' -> 2).
-        4. Fallback to 1.
+        Delegates to the module-level memoized helper so repeated header
+        texts across chunks and documents hit the cache.
 
         Args:
             text: The header text to analyze.
@@ -51,40 +128,7 @@ class SemanticChunker:
         Returns:
             Estimated depth integer (1 being top-level under Title).
         """
-        # 1. Markdown headers
-        # Matches one or more '#' at the start, potentially after whitespace
-        markdown_match = re.match(r"^\s*(#+)", text)
-        if markdown_match:
-            return len(markdown_match.group(1))
-
-        # 2. Labeled Numbering (Section, Chapter, Part, Appendix)
-        # Case insensitive. Matches "Section 1.2.3" or "Appendix A.1".
-        # We allow alphanumeric numbering like "A.1" or "1.2".
-        labelled_match = re.match(
-            r"^\s*(?:Section|Chapter|Part|Appendix)\s+([A-Za-z0-9]+(?:\.[A-Za-z0-9]+)*)",
-            text,
-            re.IGNORECASE,
-        )
-        if labelled_match:
-            numbering = labelled_match.group(1)
-            # Count dots + 1. "A" -> 1. "A.1" -> 2.
-            return numbering.count(".") + 1
-
-        # 3. Plain Numbering
-        # Matches "1.2.3" or "A.1.2".
-        # We require at least one dot for alphanumeric start to avoid matching simple words like "A".
-        match = re.match(r"^\s*([A-Za-z0-9]+(?:\.[A-Za-z0-9]+)+)", text)
-        if match:
-            numbering = match.group(1)
-            return numbering.count(".") + 1
-
-        # Fallback for simple digit-only numbering without dots (e.g. "1. Introduction")
-        match_digit = re.match(r"^\s*(\d+)\.?", text)
-        if match_digit:
-            return 1
-
-        # Default fallback
-        return 1
+        return _infer_depth_cached(text)
 
     def _clean_header_text(self, text: str) -> str:
         """Strip leading Markdown hashes and whitespace for context usage.
@@ -100,10 +144,8 @@ class SemanticChunker:
     def chunk(self, elements: List[ParsedElement]) -> List[RefinedChunk]:
         """Convert parsed elements into refined chunks with semantic context.
 
-        Implements:
-        - Header-Based Splitting.
-        - Table Preservation (merges tables spanning pages).
-        - Rolling Context (Context Injection).
+        Materializes the full result; see iter_chunks for the streaming
+        variant this delegates to.
 
         Args:
             elements: List of ParsedElement objects from the parser.
@@ -111,147 +153,243 @@ class SemanticChunker:
         Returns:
             List of RefinedChunk objects with metadata and context.
         """
-        chunks: List[RefinedChunk] = []
+        return list(self.iter_chunks(elements))
+
+    def iter_chunks(self, elements: Iterable[ParsedElement]) -> Iterator[RefinedChunk]:
+        """Stream refined chunks as the element scan progresses.
+
+        Implements:
+        - Header-Based Splitting.
+        - Table Preservation (merges tables spanning pages).
+        - Rolling Context (Context Injection).
 
-        # Stack entries: (depth, text)
-        # TITLE is always depth 0.
-        header_stack: List[Tuple[int, str]] = []
+        Chunks are yielded as soon as they are sealed, so downstream
+        stages can consume in pipeline fashion and peak memory stays
+        proportional to the active chunk rather than the whole document.
 
+        Args:
+            elements: Iterable of ParsedElement objects from the parser.
+
+        Yields:
+            RefinedChunk objects with metadata and context.
+        """
+        # Header stack as parallel lists: depths are kept strictly
+        # increasing (TITLE is always depth 0), so collapsing the stack
+        # for a new header is a bisect plus one slice deletion instead
+        # of popping entries one at a time.
+        header_depths: List[int] = []
+        header_texts: List[str] = []
+
+        # Running " > "-joined breadcrumb, maintained on push/truncate so
+        # sealing a chunk never has to re-join the stack. context_lengths
+        # remembers the breadcrumb length before each entry was appended,
+        # allowing truncation by plain slicing.
+        context_str = ""
+        context_lengths: List[int] = []
+
+        # Copy-on-write snapshot of the header path. Consecutive chunks that
+        # fall under the same headers share one tuple instead of re-building
+        # (and re-allocating) it per chunk; it is invalidated on push/pop.
+        # A tuple rather than a list so the sharing is safe: a consumer
+        # cannot mutate one chunk's hierarchy and corrupt its siblings'.
+        hierarchy_snapshot: Optional[tuple[str, ...]] = None
+
+        # Buffer of raw string tokens, including explicit separator and
+        # notes-prefix tokens, assembled with one "".join at flush; no
+        # intermediate concatenations are ever built per element.
         current_buffer: List[str] = []
-        current_metadata_accumulator: List[dict[str, Any]] = []
+        # Running character count of the buffered content (separators
+        # excluded), maintained incrementally so the size check stays
+        # O(1) per element.
+        current_buffer_len = 0
+        # Unique page numbers of the active chunk, collected during the
+        # scan so flushing only has to sort once instead of re-scanning
+        # accumulated element metadata.
+        current_pages: set[int] = set()
+
+        def flush_buffer() -> Optional[RefinedChunk]:
+            """Finalize the current buffer into a RefinedChunk, if any."""
+            nonlocal hierarchy_snapshot, current_buffer_len
 
-        def flush_buffer() -> None:
-            """Finalize the current buffer into a RefinedChunk."""
             if not current_buffer:
                 # If no content, we don't create a chunk.
                 # Just clear metadata.
-                current_metadata_accumulator.clear()
-                return
-
-            # 1. Join content
-            # Double newline to separate paragraphs/elements cleanly in Markdown
-            content_text = "\n\n".join(current_buffer)
-            current_buffer.clear()
+                current_pages.clear()
+                return None
 
-            # 2. Construct Context String (Breadcrumbs)
+            # 1. Construct Context String (Breadcrumbs)
             # "Context: Grandparent > Parent > CurrentHeader"
-            hierarchy_names = [h[1] for h in header_stack]
+            # Built at most once per distinct stack state, then shared.
+            if hierarchy_snapshot is None:
+                hierarchy_snapshot = tuple(header_texts)
+            hierarchy_names = hierarchy_snapshot
             if hierarchy_names:
-                context_prefix = "Context: " + " > ".join(hierarchy_names)
-                full_text = f"{context_prefix}\n\n{content_text}"
-            else:
-                full_text = content_text
+                # Prepend the breadcrumb as plain buffer tokens so the
+                # whole chunk text is assembled in one join pass, with no
+                # second copy of the body. The breadcrumb itself is kept
+                # up to date by the header handlers; no join needed here.
+                current_buffer[0:0] = ("Context: ", context_str, "\n\n")
+
+            # 2. Join content (separator tokens are already in place)
+            full_text = "".join(current_buffer)
+            current_buffer.clear()
+            current_buffer_len = 0
 
             # 3. Aggregate Metadata
             aggregated_meta: dict[str, Any] = {
                 "header_hierarchy": hierarchy_names,
             }
 
-            # Collect unique page numbers
-            page_numbers = set()
-            for m in current_metadata_accumulator:
-                if "page_number" in m:
-                    page_numbers.add(m["page_number"])
-
-            if page_numbers:
-                aggregated_meta["page_numbers"] = sorted(list(page_numbers))
-
-            # Clear accumulator
-            current_metadata_accumulator.clear()
+            if current_pages:
+                aggregated_meta["page_numbers"] = sorted(current_pages)
+                current_pages.clear()
 
             # 4. Create Chunk
-            chunks.append(
-                RefinedChunk(
-                    id=str(uuid.uuid4()),
-                    text=full_text,
-                    vector=[],  # Defer embedding
-                    metadata=aggregated_meta,
-                )
+            # model_construct skips pydantic validation; every field here
+            # is built internally with the right type already.
+            return RefinedChunk.model_construct(
+                id=str(uuid.uuid4()),
+                text=full_text,
+                vector=[],  # Defer embedding
+                metadata=aggregated_meta,
             )
 
+        def on_title(element: ParsedElement) -> Optional[RefinedChunk]:
+            """Handle a TITLE: seal the buffer and reset the stack."""
+            nonlocal hierarchy_snapshot, context_str
+
+            # A Title (like document title) resets the flow usually,
+            # or sits at the very top. Nothing buffered (e.g. back-to-back
+            # headers) means nothing to seal — skip the flush entirely.
+            sealed = flush_buffer() if current_buffer else None
+            # Depth 0. Wipe stack.
+            # Intern so repeated header texts share one string object
+            # across every hierarchy snapshot that references them.
+            clean_text = sys.intern(self._clean_header_text(element.text))
+            header_depths.clear()
+            header_texts.clear()
+            header_depths.append(0)
+            header_texts.append(clean_text)
+            context_lengths.clear()
+            context_lengths.append(0)
+            context_str = clean_text
+            hierarchy_snapshot = None
+            return sealed
+
+        def on_header(element: ParsedElement) -> Optional[RefinedChunk]:
+            """Handle a HEADER: seal the buffer and update the stack."""
+            nonlocal hierarchy_snapshot, context_str
+
+            sealed = flush_buffer() if current_buffer else None
+
+            # Determine depth
+            if "section_depth" in element.metadata:
+                depth = element.metadata["section_depth"]
+            else:
+                # Straight to the memoized helper; repeated boilerplate
+                # headers never touch the regex engine again.
+                depth = _infer_depth_cached(element.text)
+
+            # Update Stack
+            # Drop headers that are deeper or same depth (siblings/children
+            # of siblings) to make room for the new one, but NEVER depth 0
+            # (TITLE): Titles persist until a new Title. Depths are strictly
+            # increasing, so bisect finds the first entry >= depth and one
+            # slice deletion collapses the stack in a single memmove.
+            cut = bisect_left(header_depths, depth)
+            if cut < len(header_depths):
+                context_str = context_str[: context_lengths[cut]]
+            del header_depths[cut:]
+            del header_texts[cut:]
+            del context_lengths[cut:]
+
+            clean_text = sys.intern(self._clean_header_text(element.text))
+            # Extend the breadcrumb in place; the separator mirrors what
+            # " > ".join would produce over the stack texts.
+            context_lengths.append(len(context_str))
+            context_str = context_str + " > " + clean_text if header_texts else clean_text
+            header_depths.append(depth)
+            header_texts.append(clean_text)
+            hierarchy_snapshot = None
+            return sealed
+
+        def append_content(element: ParsedElement, notes: Optional[str], added_len: int) -> None:
+            """Append an element's content as raw tokens, no concatenation.
+
+            Speaker notes (PRD 3.1) go in as separate prefix/notes/newline
+            tokens; the double-newline paragraph separator is likewise a
+            token of its own.
+            """
+            nonlocal current_buffer_len
+            if current_buffer:
+                current_buffer.append("\n\n")
+            if notes:
+                current_buffer.extend((_NOTES_PREFIX, notes, "\n"))
+            current_buffer.append(element.text)
+            current_buffer_len += added_len
+            page = element.metadata.get("page_number")
+            if page is not None:
+                current_pages.add(page)
+
+        def content_len(element: ParsedElement, notes: Optional[str]) -> int:
+            """Character count the element will contribute to the chunk."""
+            if notes:
+                return len(element.text) + len(_NOTES_PREFIX) + len(notes) + 1
+            return len(element.text)
+
+        def on_body(element: ParsedElement) -> Optional[RefinedChunk]:
+            """Handle narrative content: flush when over segment_len."""
+            notes = element.metadata.get("speaker_notes")
+            added_len = content_len(element, notes)
+
+            sealed = None
+            if current_buffer and (current_buffer_len + added_len > self.config.segment_len):
+                sealed = flush_buffer()
+
+            append_content(element, notes, added_len)
+            return sealed
+
+        def on_table(element: ParsedElement) -> Optional[RefinedChunk]:
+            """Handle a TABLE: append regardless of the size limit.
+
+            Tables must never split mid-row, and tables spanning pages
+            must merge; we err on the side of an oversized chunk rather
+            than a broken table ("Structure is Prerequisite").
+            """
+            notes = element.metadata.get("speaker_notes")
+            append_content(element, notes, content_len(element, notes))
+            return None
+
+        # Jump table over the (interned) type tags, replacing the former
+        # if/elif comparison chain in the per-element loop. Types missing
+        # here are treated as narrative content, like UNCATEGORIZED.
+        handlers = {
+            "TITLE": on_title,
+            "HEADER": on_header,
+            "TABLE": on_table,
+            "LIST_ITEM": on_body,
+            "NARRATIVE_TEXT": on_body,
+            "UNCATEGORIZED": on_body,
+        }
+
+        # Bind loop invariants locally; attribute and method lookups add
+        # up over runs of hundreds of elements (e.g. tables spanning
+        # many pages).
+        get_handler = handlers.get
+        ignored = _IGNORED_TYPES
+
         for element in elements:
-            # -- Handle Structure (TITLE / HEADER) --
-            if element.type == "TITLE":
-                # A Title (like document title) resets the flow usually,
-                # or sits at the very top.
-                flush_buffer()
-                # Depth 0. Wipe stack.
-                clean_text = self._clean_header_text(element.text)
-                header_stack = [(0, clean_text)]
-
-            elif element.type == "HEADER":
-                flush_buffer()
-
-                # Determine depth
-                if "section_depth" in element.metadata:
-                    depth = element.metadata["section_depth"]
-                else:
-                    depth = self._infer_depth(element.text)
-
-                # Update Stack
-                # Pop headers that are deeper or same depth (siblings/children of siblings)
-                # But NEVER pop depth 0 (TITLE) if we are adding a depth >= 1.
-                # Titles (0) persist until a new Title.
-                while header_stack:
-                    last_depth, _ = header_stack[-1]
-                    # If existing header is deeper (more specific) or same depth (sibling)
-                    # we pop it to make room for the new one.
-                    # Exception: If existing is Root (0) and new is Header (>=1), keep Root.
-                    if last_depth >= depth:
-                        header_stack.pop()
-                    else:
-                        break
-
-                clean_text = self._clean_header_text(element.text)
-                header_stack.append((depth, clean_text))
-
-            # -- Handle Content (Text, Table, List, etc.) --
-            elif element.type in [
-                "NARRATIVE_TEXT",
-                "TABLE",
-                "LIST_ITEM",
-                "UNCATEGORIZED",
-            ]:
-                text_to_add = element.text
-
-                # "Speaker Notes" Extraction
-                # PRD 3.1: "Must extract Speaker Notes and append them as context"
-                # We prepend them to the content block.
-                notes = element.metadata.get("speaker_notes")
-                if notes:
-                    text_to_add = f"Speaker Notes: {notes}\n{text_to_add}"
-
-                # Calculate estimated size of current buffer
-                current_len = sum(len(s) for s in current_buffer)
-
-                # Check if adding this text exceeds segment_len
-                # However, we must NOT split TABLES mid-row.
-                # Strategy:
-                # 1. If buffer + new text > limit:
-                #    a. If new element is TABLE:
-                #       - IGNORE size limit. Append to buffer. (Preserves "Table spanning pages" merge).
-                #       - Note: If buffer already has massive Text, this creates a massive Chunk.
-                #       - Ideally, we'd flush Text first, but identifying "Table Chain" vs "Text then Table"
-                #         is tricky without lookahead.
-                #       - Given "Structure is Prerequisite", we err on the side of NOT splitting Tables.
-                #    b. If new element is NOT TABLE:
-                #       - Flush buffer. (Standard behavior).
-
-                is_table = element.type == "TABLE"
-                exceeds_limit = current_buffer and (current_len + len(text_to_add) > self.config.segment_len)
-
-                if exceeds_limit and not is_table:
-                    flush_buffer()
-
-                current_buffer.append(text_to_add)
-
-                if element.metadata:
-                    current_metadata_accumulator.append(element.metadata)
-
-            # -- Ignore Others (FOOTER, etc.) --
-            # Footers are generally page artifacts, not semantic content.
+            # -- Drop page artifacts first (FOOTER etc.) --
+            # O(1) membership test before any other branching.
+            element_type = element.type
+            if element_type in ignored:
+                continue
 
-        # End of elements: Flush remaining buffer
-        flush_buffer()
+            sealed = get_handler(element_type, on_body)(element)
+            if sealed:
+                yield sealed
 
-        return chunks
+        # End of elements: Flush remaining buffer
+        sealed = flush_buffer()
+        if sealed:
+            yield sealed
@@ -12,9 +12,9 @@ import os
 import tempfile
 import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, List
+from typing import Annotated, AsyncGenerator, List, cast
 
-from fastapi import FastAPI, Request, UploadFile
+from fastapi import Depends, FastAPI, Request, UploadFile
 
 from coreason_refinery.models import IngestionConfig, IngestionJob, RefinedChunk
 from coreason_refinery.pipeline import RefineryPipelineAsync
@@ -35,8 +35,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 app = FastAPI(lifespan=lifespan, title="Coreason Refinery", version="0.1.0")
 
 
+def get_pipeline(request: Request) -> RefineryPipelineAsync:
+    """Resolve the pipeline initialized by the lifespan (overridable in tests)."""
+    # app.state is untyped; the lifespan only ever stores a pipeline there.
+    return cast(RefineryPipelineAsync, request.app.state.pipeline)
+
+
+def get_job_id() -> uuid.UUID:
+    """Generate the id for an ingestion job (overridable in tests)."""
+    return uuid.uuid4()
+
+
 @app.post("/ingest", response_model=List[RefinedChunk])
-async def ingest(request: Request, file: UploadFile) -> List[RefinedChunk]:
+async def ingest(
+    file: UploadFile,
+    pipeline: Annotated[RefineryPipelineAsync, Depends(get_pipeline)],
+    job_id: Annotated[uuid.UUID, Depends(get_job_id)],
+) -> List[RefinedChunk]:
     """Ingest a file and return refined chunks."""
     logger.info(f"Received ingestion request for file: {file.filename}")
 
@@ -53,12 +68,10 @@ async def ingest(request: Request, file: UploadFile) -> List[RefinedChunk]:
             while chunk := await file.read(CHUNK_SIZE):
                 tmp_file.write(chunk)
 
-        job_id = uuid.uuid4()
         job = IngestionJob(
             id=job_id, source_file_path=tmp_path, file_type="auto", config=IngestionConfig(), status="PROCESSING"
         )
 
-        pipeline: RefineryPipelineAsync = request.app.state.pipeline
         chunks = await pipeline.process(job)
         return chunks
 
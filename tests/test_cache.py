@@ -0,0 +1,83 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_refinery
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from coreason_refinery.cache import ChunkEmbeddingCache
+from coreason_refinery.models import RefinedChunk
+
+
+def test_key_for_is_content_addressed() -> None:
+    """Test that the key depends on chunk text only, not identity."""
+    chunk_a = ChunkEmbeddingCache.key_for(RefinedChunk(id="1", text="Same text", vector=[]))
+    chunk_b = ChunkEmbeddingCache.key_for(RefinedChunk(id="2", text="Same text", vector=[]))
+    chunk_c = ChunkEmbeddingCache.key_for(RefinedChunk(id="3", text="Other text", vector=[]))
+
+    assert chunk_a == chunk_b
+    assert chunk_a != chunk_c
+    # 16-byte blake2b digest as hex
+    assert len(chunk_a) == 32
+
+
+def test_get_returns_none_on_miss() -> None:
+    """Test that unknown keys miss cleanly."""
+    cache = ChunkEmbeddingCache()
+    assert cache.get("deadbeef") is None
+    cache.close()
+
+
+def test_set_get_roundtrip() -> None:
+    """Test that stored vectors come back within quantization tolerance."""
+    cache = ChunkEmbeddingCache()
+    cache.set("key-1", [0.1, 0.2, 0.3])
+    cache.set("key-1", [0.4, 0.5])  # Overwrite is allowed
+
+    assert cache.get("key-1") == pytest.approx([0.4, 0.5], abs=0.01)
+    cache.close()
+
+
+def test_zero_vector_roundtrip() -> None:
+    """Test that all-zero vectors survive quantization exactly."""
+    cache = ChunkEmbeddingCache()
+    cache.set("key-0", [0.0, 0.0, 0.0])
+
+    assert cache.get("key-0") == [0.0, 0.0, 0.0]
+    cache.close()
+
+
+def test_int8_roundtrip_within_tolerance() -> None:
+    """Test that int8 quantization preserves vector direction."""
+    rng = np.random.default_rng(42)
+    vector = rng.standard_normal(768)
+    vector /= np.linalg.norm(vector)
+
+    cache = ChunkEmbeddingCache()
+    cache.set("key-unit", vector.tolist())
+    restored = np.asarray(cache.get("key-unit"))
+    cache.close()
+
+    cosine = float(np.dot(vector, restored) / (np.linalg.norm(vector) * np.linalg.norm(restored)))
+    assert cosine > 0.999
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    """Test that a file-backed cache survives reopening."""
+    db_path = str(tmp_path / "embeddings.db")
+
+    cache = ChunkEmbeddingCache(db_path)
+    cache.set("key-1", [1.0, 2.0])
+    cache.close()
+
+    reopened = ChunkEmbeddingCache(db_path)
+    assert reopened.get("key-1") == pytest.approx([1.0, 2.0], abs=0.02)
+    reopened.close()
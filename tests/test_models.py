@@ -100,3 +100,23 @@ def test_refined_chunk_defaults() -> None:
     """Test RefinedChunk defaults."""
     chunk = RefinedChunk(id="vector_id_123", text="Content", vector=[0.1])
     assert chunk.metadata == {}
+
+
+def test_refined_chunk_orjson_roundtrip() -> None:
+    """Test that to_json produces JSON bytes that round-trip intact."""
+    import json
+
+    chunk = RefinedChunk(
+        id="chunk-1",
+        text="Context: A > B\n\nBody",
+        vector=[0.0] * 768,
+        metadata={"header_hierarchy": ["A", "B"], "page_numbers": [1, 2]},
+    )
+
+    payload = chunk.to_json()
+
+    assert isinstance(payload, bytes)
+    decoded = json.loads(payload)
+    assert len(decoded["vector"]) == 768
+    assert decoded["text"] == chunk.text
+    assert decoded["metadata"]["page_numbers"] == [1, 2]
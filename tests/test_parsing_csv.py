@@ -8,32 +8,22 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
-from typing import Generator
-from unittest.mock import MagicMock, patch
+import csv
+from pathlib import Path
+from unittest.mock import patch
 
-import pandas as pd
 import pytest
 
 from coreason_refinery.parsing import ExcelParser
 
 
-@pytest.fixture
-def mock_read_csv() -> Generator[MagicMock, None, None]:
-    with patch("pandas.read_csv") as mock:
-        yield mock
-
-
-def test_csv_parser_simple(mock_read_csv: MagicMock) -> None:
+def test_csv_parser_simple(tmp_path: Path) -> None:
     """Test parsing a simple CSV file."""
-    # Setup mock DF
-    data = {"Col1": ["A", "B"], "Col2": [1, 2]}
-    df = pd.DataFrame(data)
-
-    # Mock return: df directly (read_csv returns df, not dict)
-    mock_read_csv.return_value = df
+    csv_file = tmp_path / "dummy.csv"
+    csv_file.write_text("Col1,Col2\nA,1\nB,2\n")
 
     parser = ExcelParser()
-    elements = parser.parse("dummy.csv")
+    elements = parser.parse(str(csv_file))
 
     assert len(elements) == 2
     # 1. Header (Wrapper Sheet name)
@@ -46,13 +36,13 @@ def test_csv_parser_simple(mock_read_csv: MagicMock) -> None:
     assert "A" in elements[1].text
 
 
-def test_csv_parser_empty(mock_read_csv: MagicMock) -> None:
+def test_csv_parser_empty(tmp_path: Path) -> None:
     """Test parsing an empty CSV file."""
-    df = pd.DataFrame()
-    mock_read_csv.return_value = df
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text("")
 
     parser = ExcelParser()
-    elements = parser.parse("empty.csv")
+    elements = parser.parse(str(csv_file))
 
     assert len(elements) == 2
     assert elements[0].text == "Sheet: CSV_Data"
@@ -60,16 +50,14 @@ def test_csv_parser_empty(mock_read_csv: MagicMock) -> None:
     assert elements[1].text == "(Empty Sheet)"
 
 
-def test_csv_parser_large(mock_read_csv: MagicMock) -> None:
+def test_csv_parser_large(tmp_path: Path) -> None:
     """Test splitting a large CSV file."""
-    # Create 60 rows
-    data = {"ID": range(60)}
-    df = pd.DataFrame(data)
-
-    mock_read_csv.return_value = df
+    # Create 60 data rows
+    csv_file = tmp_path / "large.csv"
+    csv_file.write_text("ID\n" + "".join(f"{i}\n" for i in range(60)))
 
     parser = ExcelParser()
-    elements = parser.parse("large.csv")
+    elements = parser.parse(str(csv_file))
 
     # Header + 2 Chunks
     assert len(elements) == 3
@@ -78,10 +66,8 @@ def test_csv_parser_large(mock_read_csv: MagicMock) -> None:
     assert elements[2].metadata["chunk_index"] == 1
 
 
-def test_csv_parser_error(mock_read_csv: MagicMock) -> None:
+def test_csv_parser_error() -> None:
     """Test error handling for CSV."""
-    mock_read_csv.side_effect = FileNotFoundError("File not found")
-
     parser = ExcelParser()
     with pytest.raises(RuntimeError) as excinfo:
         parser.parse("missing.csv")
@@ -89,59 +75,45 @@ def test_csv_parser_error(mock_read_csv: MagicMock) -> None:
     assert "Failed to parse Structured file (missing.csv)" in str(excinfo.value)
 
 
-def test_csv_parser_encoding_error(mock_read_csv: MagicMock) -> None:
+def test_csv_parser_encoding_error(tmp_path: Path) -> None:
     """Test handling of UnicodeDecodeError (simulating encoding issues)."""
-    mock_read_csv.side_effect = UnicodeDecodeError("utf-8", b"", 0, 1, "invalid start byte")
-
-    parser = ExcelParser()
-    with pytest.raises(RuntimeError) as excinfo:
-        parser.parse("latin1.csv")
-
-    assert "Failed to parse Structured file (latin1.csv)" in str(excinfo.value)
-    assert "invalid start byte" in str(excinfo.value)
-
-
-def test_csv_parser_malformed(mock_read_csv: MagicMock) -> None:
-    """Test handling of pandas ParserError (malformed CSV)."""
-    mock_read_csv.side_effect = pd.errors.ParserError("Error tokenizing data")
+    csv_file = tmp_path / "latin1.csv"
+    # 0xE9 is 'é' in latin-1 but an invalid UTF-8 continuation byte
+    csv_file.write_bytes(b"Col1\ncaf\xe9\n")
 
     parser = ExcelParser()
     with pytest.raises(RuntimeError) as excinfo:
-        parser.parse("bad_format.csv")
+        parser.parse(str(csv_file))
 
-    assert "Failed to parse Structured file (bad_format.csv)" in str(excinfo.value)
+    assert "Failed to parse Structured file" in str(excinfo.value)
+    assert "invalid continuation byte" in str(excinfo.value)
 
 
-def test_csv_parser_empty_data_error(mock_read_csv: MagicMock) -> None:
-    """Test handling of pandas EmptyDataError."""
-    # EmptyDataError is raised by pandas when a file is empty or has no columns
-    mock_read_csv.side_effect = pd.errors.EmptyDataError("No columns to parse from file")
+def test_csv_parser_malformed(tmp_path: Path) -> None:
+    """Test handling of csv.Error (malformed CSV)."""
+    csv_file = tmp_path / "bad_format.csv"
+    csv_file.write_text("Col1,Col2\nA,1\n")
 
     parser = ExcelParser()
-    with pytest.raises(RuntimeError) as excinfo:
-        parser.parse("no_columns.csv")
+    with patch("coreason_refinery.parsing.csv.reader", side_effect=csv.Error("Error tokenizing data")):
+        with pytest.raises(RuntimeError) as excinfo:
+            parser.parse(str(csv_file))
 
-    assert "Failed to parse Structured file (no_columns.csv)" in str(excinfo.value)
+    assert f"Failed to parse Structured file ({csv_file})" in str(excinfo.value)
 
 
-def test_csv_newlines_in_quotes(mock_read_csv: MagicMock) -> None:
+def test_csv_newlines_in_quotes(tmp_path: Path) -> None:
     """Test that newlines within quoted fields are preserved in the Markdown table output."""
-    # Dataframe simulating:
-    # Col1,Col2
-    # "Line 1\nLine 2",Value
-    data = {"Col1": ["Line 1\nLine 2"], "Col2": ["Value"]}
-    df = pd.DataFrame(data)
-    mock_read_csv.return_value = df
+    csv_file = tmp_path / "complex.csv"
+    csv_file.write_text('Col1,Col2\n"Line 1\nLine 2",Value\n')
 
     parser = ExcelParser()
-    elements = parser.parse("complex.csv")
+    elements = parser.parse(str(csv_file))
 
     assert len(elements) == 2
     table_text = elements[1].text
 
-    # Check that "Line 1" and "Line 2" both appear.
-    # Note: df.to_markdown() behavior on newlines depends on tablefmt.
-    # 'github' format usually keeps them as raw \n or converts to <br> depending on pandas version/tabulate.
-    # We verify the content is present.
+    # The quoted newline is collapsed to a space so the Markdown row stays
+    # on a single line, but both halves of the content survive.
     assert "Line 1" in table_text
     assert "Line 2" in table_text
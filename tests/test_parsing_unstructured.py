@@ -127,6 +127,31 @@ def test_metadata_preservation(parser: UnstructuredPdfParser) -> None:
         assert meta_out["languages"] == ["eng"]
 
 
+def test_metadata_normalization(parser: UnstructuredPdfParser) -> None:
+    """Test that path-like and numeric metadata are coerced to plain types."""
+    from pathlib import Path
+
+    metadata = ElementMetadata(
+        page_number=7,
+        filename=str(Path("test.pdf")),
+        file_directory=str(Path("/tmp")),
+        languages=["eng", "deu"],
+    )
+    element = NarrativeText(text="Normalize Me", metadata=metadata)
+
+    with patch("coreason_refinery.parsing.partition_pdf", return_value=[element]):
+        results = parser.parse("test.pdf")
+
+        meta_out = results[0].metadata
+        # Exact builtin types, ready for orjson's fast path. isinstance would
+        # be too lenient here (bool passes isinstance(..., int)), so the
+        # identity comparisons are deliberate.
+        assert type(meta_out["page_number"]) is int  # noqa: E721
+        assert type(meta_out["filename"]) is str  # noqa: E721
+        assert type(meta_out["file_directory"]) is str  # noqa: E721
+        assert all(type(lang) is str for lang in meta_out["languages"])  # noqa: E721
+
+
 def test_element_ordering(parser: UnstructuredPdfParser) -> None:
     """Test that the order of elements is strictly preserved."""
     elements = [
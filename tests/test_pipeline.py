@@ -9,19 +9,60 @@
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
 import uuid
-from typing import List
+from typing import Generator, List
 from unittest.mock import patch
 
 import pytest
 
+from coreason_refinery.embedding import Embedder
 from coreason_refinery.models import IngestionConfig, IngestionJob, RefinedChunk
-from coreason_refinery.parsing import ParsedElement
+from coreason_refinery.parsing import DocumentParser, ParsedElement
 from coreason_refinery.pipeline import RefineryPipeline
 
 
-@pytest.fixture
-def pipeline() -> RefineryPipeline:
-    return RefineryPipeline()
+class RecordingParser(DocumentParser):
+    """Lightweight injectable parser fake; records paths it was asked to parse."""
+
+    def __init__(self, elements: List[ParsedElement]) -> None:
+        self.elements = elements
+        self.parsed_paths: List[str] = []
+
+    def parse(self, file_path: str) -> List[ParsedElement]:
+        self.parsed_paths.append(file_path)
+        return self.elements
+
+
+class RecordingChunker:
+    """Lightweight injectable chunker fake; records the elements it chunked."""
+
+    def __init__(self, config: IngestionConfig) -> None:
+        self.config = config
+        self.chunked: List[List[ParsedElement]] = []
+
+    def chunk(self, elements: List[ParsedElement]) -> List[RefinedChunk]:
+        self.chunked.append(elements)
+        return [RefinedChunk(id="1", text="Chunk 1", vector=[])]
+
+
+class CountingEmbedder(Embedder):
+    """Embedder fake; records texts and returns deterministic vectors."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    def embed(self, text: str) -> List[float]:
+        self.embedded.append(text)
+        return [float(len(text))]
+
+
+@pytest.fixture(scope="module")
+def pipeline() -> Generator[RefineryPipeline, None, None]:
+    """One pipeline for the whole module; no test mutates it."""
+    pipeline = RefineryPipeline()
+    yield pipeline
+    # Guard against cross-test leakage through the shared instance
+    assert pipeline._async._parser_overrides == {}
+    assert pipeline._async._chunker_cls is None
 
 
 @pytest.fixture
@@ -34,7 +75,7 @@ def sample_job() -> IngestionJob:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_elements() -> List[ParsedElement]:
     return [
         ParsedElement(text="Title", type="TITLE", metadata={}),
@@ -44,61 +85,51 @@ def mock_elements() -> List[ParsedElement]:
 
 
 def test_process_pdf_auto_detection(
-    pipeline: RefineryPipeline,
     sample_job: IngestionJob,
     mock_elements: List[ParsedElement],
 ) -> None:
-    """Test that PDF files are correctly routed to UnstructuredPdfParser."""
-    # Mock the parser and chunker
-    with (
-        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
-        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
-    ):
-        # Setup mocks
-        mock_parser_instance = MockPdfParser.return_value
-        mock_parser_instance.parse.return_value = mock_elements
+    """Test that PDF files are correctly routed to the injected PDF parser."""
+    # Direct dependency injection; no mock.patch machinery needed
+    parser = RecordingParser(mock_elements)
+    chunkers: List[RecordingChunker] = []
 
-        mock_chunker_instance = MockChunker.return_value
-        mock_chunker_instance.chunk.return_value = [RefinedChunk(id="1", text="Chunk 1", vector=[])]
+    def make_chunker(config: IngestionConfig) -> RecordingChunker:
+        chunker = RecordingChunker(config)
+        chunkers.append(chunker)
+        return chunker
 
-        # Ensure job is set to auto
-        sample_job.file_type = "auto"
-        sample_job.source_file_path = "/tmp/doc.pdf"
+    pipeline = RefineryPipeline(pdf_parser_cls=lambda: parser, chunker_cls=make_chunker)
 
-        # Execute
-        result = pipeline.process(sample_job)
+    # Ensure job is set to auto
+    sample_job.file_type = "auto"
+    sample_job.source_file_path = "/tmp/doc.pdf"
 
-        # Verify
-        MockPdfParser.assert_called_once()
-        mock_parser_instance.parse.assert_called_once_with("/tmp/doc.pdf")
-        MockChunker.assert_called_once_with(sample_job.config)
-        mock_chunker_instance.chunk.assert_called_once_with(mock_elements)
-        assert len(result) == 1
-        assert result[0].text == "Chunk 1"
+    # Execute
+    result = pipeline.process(sample_job)
+
+    # Verify
+    assert parser.parsed_paths == ["/tmp/doc.pdf"]
+    assert len(chunkers) == 1
+    assert chunkers[0].config == sample_job.config
+    assert chunkers[0].chunked == [mock_elements]
+    assert len(result) == 1
+    assert result[0].text == "Chunk 1"
 
 
 def test_process_excel_explicit_type(
-    pipeline: RefineryPipeline,
     sample_job: IngestionJob,
     mock_elements: List[ParsedElement],
 ) -> None:
-    """Test explicit Excel file type routing."""
-    with (
-        patch("coreason_refinery.pipeline.ExcelParser") as MockExcelParser,
-        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
-    ):
-        mock_parser_instance = MockExcelParser.return_value
-        mock_parser_instance.parse.return_value = mock_elements
-
-        mock_chunker_instance = MockChunker.return_value
-        mock_chunker_instance.chunk.return_value = []
+    """Test explicit Excel file type routing via the injected parser."""
+    parser = RecordingParser(mock_elements)
+    pipeline = RefineryPipeline(excel_parser_cls=lambda: parser, chunker_cls=RecordingChunker)
 
-        sample_job.file_type = "excel"
-        sample_job.source_file_path = "/tmp/data.xlsx"
+    sample_job.file_type = "excel"
+    sample_job.source_file_path = "/tmp/data.xlsx"
 
-        pipeline.process(sample_job)
+    pipeline.process(sample_job)
 
-        MockExcelParser.assert_called_once()
+    assert parser.parsed_paths == ["/tmp/data.xlsx"]
 
 
 def test_unsupported_file_type(pipeline: RefineryPipeline) -> None:
@@ -175,6 +206,28 @@ def test_auto_detection_csv(pipeline: RefineryPipeline, mock_elements: List[Pars
         MockExcelParser.assert_called_once()
 
 
+def test_dispatch_table_is_dict_lookup(pipeline: RefineryPipeline, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that new file types route via the registry without code changes."""
+    import coreason_refinery.pipeline as pipeline_module
+    from tests.mocks import MockParser
+
+    monkeypatch.setitem(pipeline_module._PARSER_REGISTRY, "mock", lambda: MockParser)
+
+    job = IngestionJob(
+        id=uuid.uuid4(),
+        source_file_path="/tmp/anything.mock",
+        file_type="mock",
+        config=IngestionConfig(),
+        status="PROCESSING",
+    )
+
+    result = pipeline.process(job)
+
+    # MockParser emits a Title + Header + Text + Table document
+    assert len(result) > 0
+    assert "Clinical Protocol" in result[0].text
+
+
 def test_auto_detection_failure(pipeline: RefineryPipeline) -> None:
     """Test auto-detection failure for unknown extensions."""
     job = IngestionJob(
@@ -203,15 +256,14 @@ def test_process_empty_document(pipeline: RefineryPipeline, sample_job: Ingestio
     ):
         # Parser returns empty list
         MockPdfParser.return_value.parse.return_value = []
-        # Chunker returns empty list
-        MockChunker.return_value.chunk.return_value = []
 
         sample_job.file_type = "pdf"
         result = pipeline.process(sample_job)
 
         assert result == []
         MockPdfParser.return_value.parse.assert_called_once()
-        MockChunker.return_value.chunk.assert_called_once_with([])
+        # Empty documents short-circuit before the chunker is even built
+        MockChunker.assert_not_called()
 
 
 def test_process_case_insensitive_extension(pipeline: RefineryPipeline) -> None:
@@ -305,6 +357,87 @@ def test_complex_data_flow(pipeline: RefineryPipeline) -> None:
         assert result[0].metadata["header_hierarchy"] == ["H1"]
 
 
+def test_process_batch_parallel(pipeline: RefineryPipeline) -> None:
+    """Test that process_batch fans jobs out across threads.
+
+    All four parses must be in flight at the same time; a sequential run
+    would deadlock on the barrier and time out instead.
+    """
+    import threading
+
+    jobs = [
+        IngestionJob(
+            id=uuid.uuid4(),
+            source_file_path=f"/tmp/doc{i}.pdf",
+            file_type="pdf",
+            config=IngestionConfig(),
+            status="PROCESSING",
+        )
+        for i in range(4)
+    ]
+
+    # Structural concurrency check: each parse blocks until all four have
+    # started, which only a parallel executor can satisfy. No wall-clock
+    # bound, so the test cannot flake on loaded CI.
+    barrier = threading.Barrier(len(jobs), timeout=10)
+
+    def concurrent_parse(path: str) -> List[ParsedElement]:
+        barrier.wait()
+        return [ParsedElement(text=path, type="NARRATIVE_TEXT", metadata={})]
+
+    with (
+        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
+        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
+    ):
+        MockPdfParser.return_value.parse.side_effect = concurrent_parse
+        MockChunker.return_value.chunk.side_effect = lambda elements: [
+            RefinedChunk(id="x", text=elements[0].text, vector=[])
+        ]
+
+        results = pipeline.process_batch(jobs, max_workers=4)
+
+    assert not barrier.broken
+    # Results are ordered by input index
+    assert [r[0].text for r in results] == [job.source_file_path for job in jobs]
+
+
+def test_process_batch_error_isolation(pipeline: RefineryPipeline) -> None:
+    """Test that a failing job surfaces its error without blocking the rest."""
+    jobs = [
+        IngestionJob(
+            id=uuid.uuid4(),
+            source_file_path=path,
+            file_type="pdf",
+            config=IngestionConfig(),
+            status="PROCESSING",
+        )
+        for path in ["/tmp/good.pdf", "/tmp/bad.pdf"]
+    ]
+
+    parsed_paths: List[str] = []
+
+    def selective_parse(path: str) -> List[ParsedElement]:
+        parsed_paths.append(path)
+        if "bad" in path:
+            raise Exception("Parsing crashed")
+        return [ParsedElement(text=path, type="NARRATIVE_TEXT", metadata={})]
+
+    with (
+        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
+        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
+    ):
+        MockPdfParser.return_value.parse.side_effect = selective_parse
+        MockChunker.return_value.chunk.return_value = []
+
+        with pytest.raises(RuntimeError) as excinfo:
+            pipeline.process_batch(jobs, max_workers=2)
+
+    # The bad job fails with the usual per-job wrapping...
+    assert "Pipeline processing failed: Parsing crashed" in str(excinfo.value)
+    # ...but the good job was still executed.
+    assert "/tmp/good.pdf" in parsed_paths
+
+
 def test_pipeline_sync_context_manager() -> None:
     """Test that the Sync Facade works as a context manager.
 
@@ -312,3 +445,125 @@ def test_pipeline_sync_context_manager() -> None:
     """
     with RefineryPipeline() as pipeline:
         assert isinstance(pipeline, RefineryPipeline)
+
+
+def test_embedding_cache_hit_skips_model(
+    sample_job: IngestionJob,
+    mock_elements: List[ParsedElement],
+) -> None:
+    """Test that re-processing identical content never calls the embedder."""
+    parser = RecordingParser(mock_elements)
+    embedder = CountingEmbedder()
+    pipeline = RefineryPipeline(pdf_parser_cls=lambda: parser, embedder=embedder)
+
+    sample_job.file_type = "pdf"
+
+    first = pipeline.process(sample_job)
+
+    # Every chunk was embedded exactly once and carries its vector
+    assert len(embedder.embedded) == len(first) > 0
+    assert all(chunk.vector == [float(len(chunk.text))] for chunk in first)
+
+    second = pipeline.process(sample_job)
+
+    # Identical chunk texts resolve entirely from the content-hash cache;
+    # cached vectors are int8-quantized, hence the tolerance.
+    assert len(embedder.embedded) == len(first)
+    for cached, fresh in zip(second, first, strict=True):
+        assert cached.vector == pytest.approx(fresh.vector, rel=0.01)
+
+
+def test_no_embedder_defers_vectors(sample_job: IngestionJob, mock_elements: List[ParsedElement]) -> None:
+    """Test that without an embedder, vectors stay deferred (empty)."""
+    pipeline = RefineryPipeline(pdf_parser_cls=lambda: RecordingParser(mock_elements))
+
+    sample_job.file_type = "pdf"
+    result = pipeline.process(sample_job)
+
+    assert all(chunk.vector == [] for chunk in result)
+
+
+class BatchingEmbedder(Embedder):
+    """Embedder fake exposing a real batch API; records each batch."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def embed(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        return [self.embed(text) for text in texts]
+
+
+def test_embed_called_in_batches(sample_job: IngestionJob, mock_elements: List[ParsedElement]) -> None:
+    """Test that all cache misses of a job reach the embedder in one call."""
+
+    class MultiChunker(RecordingChunker):
+        def chunk(self, elements: List[ParsedElement]) -> List[RefinedChunk]:
+            return [RefinedChunk(id=str(i), text=f"Chunk {i}", vector=[]) for i in range(3)]
+
+    embedder = BatchingEmbedder()
+    pipeline = RefineryPipeline(
+        pdf_parser_cls=lambda: RecordingParser(mock_elements),
+        chunker_cls=MultiChunker,
+        embedder=embedder,
+    )
+
+    sample_job.file_type = "pdf"
+    result = pipeline.process(sample_job)
+
+    # One batch call covering every chunk text, not one call per chunk
+    assert embedder.batches == [["Chunk 0", "Chunk 1", "Chunk 2"]]
+    assert all(chunk.vector == [float(len(chunk.text))] for chunk in result)
+
+
+def test_embed_batch_size_slicing() -> None:
+    """Test that misses beyond batch_size are sliced into further calls."""
+    embedder = BatchingEmbedder()
+    pipeline = RefineryPipeline(embedder=embedder)
+
+    chunks = [RefinedChunk(id=str(i), text=f"Text {i}", vector=[]) for i in range(5)]
+    pipeline._async._embed_chunks(chunks, batch_size=2)
+
+    assert [len(batch) for batch in embedder.batches] == [2, 2, 1]
+
+
+def test_parser_instance_reused_across_jobs(sample_job: IngestionJob, mock_elements: List[ParsedElement]) -> None:
+    """Test that repeat jobs reuse the pooled parser instance."""
+    with (
+        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
+        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
+    ):
+        MockPdfParser.return_value.parse.return_value = mock_elements
+        MockChunker.return_value.chunk.return_value = []
+
+        pipeline = RefineryPipeline()
+        sample_job.file_type = "pdf"
+
+        pipeline.process(sample_job)
+        pipeline.process(sample_job)
+
+        # Constructed once, parsed twice
+        assert MockPdfParser.call_count == 1
+        assert MockPdfParser.return_value.parse.call_count == 2
+
+
+def test_injected_parser_factory_called_once(sample_job: IngestionJob, mock_elements: List[ParsedElement]) -> None:
+    """Test that injected parser factories are also pooled across jobs."""
+    constructed: List[RecordingParser] = []
+
+    def make_parser() -> RecordingParser:
+        parser = RecordingParser(mock_elements)
+        constructed.append(parser)
+        return parser
+
+    pipeline = RefineryPipeline(pdf_parser_cls=make_parser, chunker_cls=RecordingChunker)
+    sample_job.file_type = "pdf"
+
+    pipeline.process(sample_job)
+    pipeline.process(sample_job)
+
+    assert len(constructed) == 1
+    assert constructed[0].parsed_paths == [sample_job.source_file_path] * 2
@@ -67,6 +67,94 @@ async def test_pipeline_async_process(sample_job: IngestionJob, mock_elements: L
             mock_chunker.chunk.assert_called_once_with(mock_elements)
 
 
+@pytest.mark.anyio
+async def test_process_many_concurrency() -> None:
+    """Test that process_many overlaps jobs up to the concurrency limit."""
+    import threading
+    import time
+
+    jobs = [
+        IngestionJob(
+            id=uuid.uuid4(),
+            source_file_path=f"/tmp/doc{i}.pdf",
+            file_type="pdf",
+            config=IngestionConfig(),
+            status="PROCESSING",
+        )
+        for i in range(10)
+    ]
+
+    # Track peak in-flight parses instead of wall-clock time: timing bounds
+    # flake on loaded CI, the overlap count does not.
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def tracking_parse(path: str) -> List[ParsedElement]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return [ParsedElement(text=path, type="NARRATIVE_TEXT", metadata={})]
+
+    with (
+        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
+        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
+    ):
+        MockPdfParser.return_value.parse.side_effect = tracking_parse
+        MockChunker.return_value.chunk.side_effect = lambda elements: [
+            RefinedChunk(id="x", text=elements[0].text, vector=[])
+        ]
+
+        async with RefineryPipelineAsync() as pipeline:
+            results = await pipeline.process_many(jobs, max_concurrency=8)
+
+    # Jobs overlapped, and the semaphore never admitted more than the limit
+    assert peak > 1
+    assert peak <= 8
+    assert [r[0].text for r in results] == [job.source_file_path for job in jobs]
+
+
+@pytest.mark.anyio
+async def test_process_many_failure_raises_runtime_error() -> None:
+    """Test that a failing job surfaces the documented RuntimeError.
+
+    The task group wraps child failures in an ExceptionGroup; process_many
+    must unwrap it so callers can catch plain RuntimeError.
+    """
+    jobs = [
+        IngestionJob(
+            id=uuid.uuid4(),
+            source_file_path=path,
+            file_type="pdf",
+            config=IngestionConfig(),
+            status="PROCESSING",
+        )
+        for path in ["/tmp/good.pdf", "/tmp/bad.pdf"]
+    ]
+
+    def selective_parse(path: str) -> List[ParsedElement]:
+        if "bad" in path:
+            raise Exception("Parsing crashed")
+        return [ParsedElement(text=path, type="NARRATIVE_TEXT", metadata={})]
+
+    with (
+        patch("coreason_refinery.pipeline.UnstructuredPdfParser") as MockPdfParser,
+        patch("coreason_refinery.pipeline.SemanticChunker") as MockChunker,
+    ):
+        MockPdfParser.return_value.parse.side_effect = selective_parse
+        MockChunker.return_value.chunk.return_value = []
+
+        async with RefineryPipelineAsync() as pipeline:
+            with pytest.raises(RuntimeError) as excinfo:
+                await pipeline.process_many(jobs)
+
+    assert "Pipeline processing failed: Parsing crashed" in str(excinfo.value)
+
+
 @pytest.mark.anyio
 async def test_resource_cleanup() -> None:
     """Test that the internal client is closed on exit."""
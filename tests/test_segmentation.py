@@ -8,6 +8,8 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
+from typing import Generator
+
 import pytest
 
 from coreason_refinery.models import IngestionConfig
@@ -15,7 +17,7 @@ from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chunker() -> SemanticChunker:
     config = IngestionConfig()
     return SemanticChunker(config)
@@ -43,19 +45,19 @@ def test_hierarchy_stacking(chunker: SemanticChunker) -> None:
     assert len(chunks) == 3
 
     # Check Chunk 0
-    assert chunks[0].metadata["header_hierarchy"] == ["Protocol", "1. Introduction"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Protocol", "1. Introduction")
     assert "Context: Protocol > 1. Introduction" in chunks[0].text
     assert "Text 1" in chunks[0].text
 
     # Check Chunk 1
-    assert chunks[1].metadata["header_hierarchy"] == ["Protocol", "1. Introduction", "1.1 Background"]
+    assert chunks[1].metadata["header_hierarchy"] == ("Protocol", "1. Introduction", "1.1 Background")
     assert "Context: Protocol > 1. Introduction > 1.1 Background" in chunks[1].text
     assert "Text 1.1" in chunks[1].text
 
     # Check Chunk 2
     # "2. Methods" (Depth 1) should pop "1.1" (Depth 2) AND "1. Introduction" (Depth 1)
     # Stack should be ["Protocol", "2. Methods"]
-    assert chunks[2].metadata["header_hierarchy"] == ["Protocol", "2. Methods"]
+    assert chunks[2].metadata["header_hierarchy"] == ("Protocol", "2. Methods")
     assert "Context: Protocol > 2. Methods" in chunks[2].text
     assert "Text 2" in chunks[2].text
 
@@ -114,12 +116,12 @@ def test_title_reset(chunker: SemanticChunker) -> None:
     assert len(chunks) == 2
 
     # Chunk 0 from Old Doc
-    assert chunks[0].metadata["header_hierarchy"] == ["Old Doc", "Header 1"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Old Doc", "Header 1")
 
     # Chunk 1 from New Doc
     # Should NOT contain Old Doc or Header 1
     assert "Old Doc" not in chunks[1].metadata["header_hierarchy"]
-    assert chunks[1].metadata["header_hierarchy"] == ["New Doc", "Header A"]
+    assert chunks[1].metadata["header_hierarchy"] == ("New Doc", "Header A")
 
 
 def test_infer_depth_logic(chunker: SemanticChunker) -> None:
@@ -140,11 +142,47 @@ def test_infer_depth_logic(chunker: SemanticChunker) -> None:
     assert chunker._infer_depth("1. Top") == 1
     assert chunker._infer_depth("1.2 Sub") == 2
     assert chunker._infer_depth("1.2.3 Deep") == 3
+    # The digit/dot fast path and the regex patterns must agree when the
+    # numbering is glued to the title (regex territory).
+    assert chunker._infer_depth("1.2 Sub") == chunker._infer_depth("1.2Sub")
+    assert chunker._infer_depth("1.Introduction") == 2
 
     # 4. Fallback
     assert chunker._infer_depth("Introduction") == 1
 
 
+def test_infer_depth_uses_precompiled_patterns(chunker: SemanticChunker) -> None:
+    """Test that depth patterns are compiled once at module import."""
+    import re
+
+    from coreason_refinery import segmentation
+
+    assert isinstance(segmentation._DEPTH_RE, re.Pattern)
+    # One alternation covers every numbering style
+    assert set(segmentation._DEPTH_RE.groupindex) == {"labeled", "dotted"}
+
+    # Markdown depth is counted with plain string ops, one per hash
+    assert chunker._infer_depth("####### x") == 7
+
+
+def test_infer_depth_is_memoized(chunker: SemanticChunker) -> None:
+    """Test that repeated header texts hit the depth-inference cache."""
+    from coreason_refinery.segmentation import _infer_depth_cached
+
+    _infer_depth_cached.cache_clear()
+
+    headers = ["# Heading 1", "Section 1", "1.2 Sub", "Introduction"]
+    for text in headers:
+        chunker._infer_depth(text)
+    # Second pass over identical texts should be pure cache hits
+    for text in headers:
+        chunker._infer_depth(text)
+
+    info = _infer_depth_cached.cache_info()
+    assert info.hits >= len(headers)
+    assert info.misses == len(headers)
+
+
 def test_no_header_doc(chunker: SemanticChunker) -> None:
     """Test behavior with a document that has no headers."""
     elements = [
@@ -155,13 +193,106 @@ def test_no_header_doc(chunker: SemanticChunker) -> None:
     chunks = chunker.chunk(elements)
     # Should produce 1 chunk with all text, empty context
     assert len(chunks) == 1
-    assert chunks[0].metadata["header_hierarchy"] == []
+    assert chunks[0].metadata["header_hierarchy"] == ()
     assert "Just some text" in chunks[0].text
     assert "More text" in chunks[0].text
     # No "Context: " prefix if hierarchy is empty
     assert "Context: " not in chunks[0].text
 
 
+def test_header_strings_interned(chunker: SemanticChunker) -> None:
+    """Test that identical header texts share one string object."""
+    # The same "Overview" header is pushed twice under different parents,
+    # so each push cleans the text independently; interning makes both
+    # hierarchy snapshots reference the same object.
+    elements = [
+        ParsedElement(text="1. Alpha", type="HEADER", metadata={"section_depth": 1}),
+        ParsedElement(text="Overview", type="HEADER", metadata={"section_depth": 2}),
+        ParsedElement(text="Alpha overview text", type="NARRATIVE_TEXT"),
+        ParsedElement(text="2. Beta", type="HEADER", metadata={"section_depth": 1}),
+        ParsedElement(text="Overview", type="HEADER", metadata={"section_depth": 2}),
+        ParsedElement(text="Beta overview text", type="NARRATIVE_TEXT"),
+    ]
+
+    chunks = chunker.chunk(elements)
+
+    assert len(chunks) == 2
+    assert chunks[0].metadata["header_hierarchy"] == ("1. Alpha", "Overview")
+    assert chunks[1].metadata["header_hierarchy"] == ("2. Beta", "Overview")
+    assert chunks[0].metadata["header_hierarchy"][1] is chunks[1].metadata["header_hierarchy"][1]
+
+
+def test_large_chunk_assembly_is_linear() -> None:
+    """Test that a very wide chunk assembles quickly (single-join build)."""
+    import time
+
+    # Huge segment_len so all pieces land in one chunk
+    chunker = SemanticChunker(IngestionConfig(segment_len=10**9))
+    elements = [ParsedElement(text="1. Bulk", type="HEADER")]
+    elements += [ParsedElement(text=f"Narrative piece {i}", type="NARRATIVE_TEXT") for i in range(10_000)]
+
+    start = time.perf_counter()
+    chunks = chunker.chunk(elements)
+    elapsed = time.perf_counter() - start
+
+    assert len(chunks) == 1
+    assert chunks[0].text.startswith("Context: 1. Bulk")
+    assert "Narrative piece 9999" in chunks[0].text
+    # Linear-time assembly finishes in milliseconds; this bound only trips
+    # on quadratic re-concatenation regressions.
+    assert elapsed < 2.0
+
+
+def test_iter_chunks_is_lazy(chunker: SemanticChunker) -> None:
+    """Test that iter_chunks consumes elements only as chunks are pulled."""
+    consumed: list[str] = []
+
+    def element_stream() -> "Generator[ParsedElement, None, None]":
+        source = [
+            ParsedElement(text="1. First", type="HEADER"),
+            ParsedElement(text="Body one", type="NARRATIVE_TEXT"),
+            ParsedElement(text="2. Second", type="HEADER"),
+            ParsedElement(text="Body two", type="NARRATIVE_TEXT"),
+        ]
+        for element in source:
+            consumed.append(element.text)
+            yield element
+
+    iterator = chunker.iter_chunks(element_stream())
+    # Nothing is consumed before the first chunk is requested
+    assert consumed == []
+
+    first = next(iterator)
+    assert "Body one" in first.text
+    # Only the elements needed to seal the first chunk have been read
+    assert "Body two" not in consumed
+
+    rest = list(iterator)
+    assert len(rest) == 1
+    assert "Body two" in rest[0].text
+
+
+def test_hierarchy_snapshot_shared_between_adjacent_chunks() -> None:
+    """Test that chunks under the same headers reuse one hierarchy snapshot."""
+    # Tiny segment_len forces each narrative block into its own chunk
+    chunker = SemanticChunker(IngestionConfig(segment_len=10))
+    elements = [
+        ParsedElement(text="Doc", type="TITLE"),
+        ParsedElement(text="1. Intro", type="HEADER"),
+        ParsedElement(text="First narrative block", type="NARRATIVE_TEXT"),
+        ParsedElement(text="Second narrative block", type="NARRATIVE_TEXT"),
+    ]
+
+    chunks = chunker.chunk(elements)
+
+    assert len(chunks) == 2
+    assert chunks[0].metadata["header_hierarchy"] == ("Doc", "1. Intro")
+    # Same stack state -> the exact same snapshot object, not a copy.
+    # A tuple, so the sharing cannot leak mutations between chunks.
+    assert isinstance(chunks[0].metadata["header_hierarchy"], tuple)
+    assert chunks[0].metadata["header_hierarchy"] is chunks[1].metadata["header_hierarchy"]
+
+
 def test_explicit_depth_override(chunker: SemanticChunker) -> None:
     """Test that metadata 'section_depth' overrides inference."""
     elements = [
@@ -172,7 +303,7 @@ def test_explicit_depth_override(chunker: SemanticChunker) -> None:
     ]
 
     chunks = chunker.chunk(elements)
-    assert chunks[0].metadata["header_hierarchy"] == ["Root", "First", "Second"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Root", "First", "Second")
 
 
 def test_chunk_page_numbers_aggregation(chunker: SemanticChunker) -> None:
@@ -203,6 +334,28 @@ def test_footer_ignored(chunker: SemanticChunker) -> None:
     assert "Footer Text" not in chunks[0].text
 
 
+def test_ignored_types_fast_path(chunker: SemanticChunker, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that _IGNORED_TYPES is the single source of truth for drops."""
+    from coreason_refinery import segmentation
+
+    monkeypatch.setattr(segmentation, "_IGNORED_TYPES", frozenset({"FOOTER", "TITLE"}))
+
+    elements = [
+        ParsedElement(text="Doc Title", type="TITLE"),
+        ParsedElement(text="Header", type="HEADER"),
+        ParsedElement(text="Content", type="NARRATIVE_TEXT"),
+        ParsedElement(text="Footer Text", type="FOOTER"),
+    ]
+
+    chunks = chunker.chunk(elements)
+
+    assert len(chunks) == 1
+    # With TITLE in the ignore set, the title never reaches the stack
+    assert chunks[0].metadata["header_hierarchy"] == ("Header",)
+    assert "Doc Title" not in chunks[0].text
+    assert "Footer Text" not in chunks[0].text
+
+
 def test_mixed_hierarchy(chunker: SemanticChunker) -> None:
     """Test mixed hierarchy types (Markdown + Labeled)."""
     elements = [
@@ -218,9 +371,22 @@ def test_mixed_hierarchy(chunker: SemanticChunker) -> None:
 
     # Chunk 0
     # Cleaned header expectations:
-    assert chunks[0].metadata["header_hierarchy"] == ["Root", "Section 1.1"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Root", "Section 1.1")
 
     # Chunk 1
     # ## Branch (Depth 2) should pop Section 1.1 (Depth 2) but keep # Root (Depth 1)
     # Cleaned header expectations:
-    assert chunks[1].metadata["header_hierarchy"] == ["Root", "Branch"]
+    assert chunks[1].metadata["header_hierarchy"] == ("Root", "Branch")
+
+
+def test_dispatch_unknown_type_falls_back_to_body(chunker: SemanticChunker) -> None:
+    """Test that unknown element types are treated as narrative content."""
+    elements = [
+        ParsedElement(text="1. Results", type="HEADER"),
+        ParsedElement.model_construct(text="Some exotic block", type="SOMETHING_NEW", metadata={}),
+    ]
+
+    chunks = chunker.chunk(elements)
+
+    assert len(chunks) == 1
+    assert "Some exotic block" in chunks[0].text
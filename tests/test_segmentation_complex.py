@@ -15,7 +15,7 @@ from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chunker() -> SemanticChunker:
     config = IngestionConfig()
     return SemanticChunker(config)
@@ -52,27 +52,27 @@ def test_the_report_structure(chunker: SemanticChunker) -> None:
     assert len(chunks) == 6
 
     # 1. Executive Summary
-    assert chunks[0].metadata["header_hierarchy"] == ["Report Title", "Executive Summary"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Report Title", "Executive Summary")
 
     # 2. Background (Should pop Exec Summary)
-    assert chunks[1].metadata["header_hierarchy"] == ["Report Title", "Background"]
+    assert chunks[1].metadata["header_hierarchy"] == ("Report Title", "Background")
 
     # 3. Problem (Should append to Background)
-    assert chunks[2].metadata["header_hierarchy"] == ["Report Title", "Background", "Problem"]
+    assert chunks[2].metadata["header_hierarchy"] == ("Report Title", "Background", "Problem")
 
     # 4. Solution (Should pop Problem, keep Background)
-    assert chunks[3].metadata["header_hierarchy"] == ["Report Title", "Background", "Solution"]
+    assert chunks[3].metadata["header_hierarchy"] == ("Report Title", "Background", "Solution")
 
     # 5. Details (Should append to Solution)
-    assert chunks[4].metadata["header_hierarchy"] == [
+    assert chunks[4].metadata["header_hierarchy"] == (
         "Report Title",
         "Background",
         "Solution",
         "Details",
-    ]
+    )
 
     # 6. Conclusion (Should pop Details, Solution, Background. Keep Title)
-    assert chunks[5].metadata["header_hierarchy"] == ["Report Title", "Conclusion"]
+    assert chunks[5].metadata["header_hierarchy"] == ("Report Title", "Conclusion")
 
 
 def test_empty_section_nightmare(chunker: SemanticChunker) -> None:
@@ -92,7 +92,7 @@ def test_empty_section_nightmare(chunker: SemanticChunker) -> None:
     # Note: Chapter 1 itself generates NO chunk because it has no content.
 
     assert len(chunks) == 1
-    assert chunks[0].metadata["header_hierarchy"] == ["Title", "Chapter 1", "Section 1.1"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Title", "Chapter 1", "Section 1.1")
     assert "Context: Title > Chapter 1 > Section 1.1" in chunks[0].text
 
 
@@ -172,7 +172,7 @@ def test_complex_mixed_attributes(chunker: SemanticChunker) -> None:
     chunk = chunks[0]
 
     # Check Hierarchy Context
-    expected_hierarchy = ["Research Report", "Appendix A", "A.1 Data", "A.1.2 Tables"]
+    expected_hierarchy = ("Research Report", "Appendix A", "A.1 Data", "A.1.2 Tables")
     assert chunk.metadata["header_hierarchy"] == expected_hierarchy
     assert "Context: Research Report > Appendix A > A.1 Data > A.1.2 Tables" in chunk.text
 
@@ -212,14 +212,14 @@ def test_edge_case_empty_title_and_orphaned_content(chunker: SemanticChunker) ->
 
     # Chunk 0
     assert chunks[0].text.strip() == "Orphaned text."
-    assert chunks[0].metadata["header_hierarchy"] == []
+    assert chunks[0].metadata["header_hierarchy"] == ()
 
     # Chunk 1
     # Title text is empty string, so it effectively adds nothing visible to breadcrumbs if we just join
     # But it is in the stack.
     # Context:  > Section 1  (Because empty string joined).
     assert "Section content." in chunks[1].text
-    assert chunks[1].metadata["header_hierarchy"] == ["", "Section 1"]
+    assert chunks[1].metadata["header_hierarchy"] == ("", "Section 1")
 
     # Verify context string formatting with empty title
     # "Context:  > Section 1"
@@ -8,12 +8,21 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
+import re
+
+import pytest
+
 from coreason_refinery.models import IngestionConfig
 from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
-def test_interrupted_flow_merging() -> None:
+@pytest.fixture(scope="module")
+def chunker() -> SemanticChunker:
+    return SemanticChunker(IngestionConfig())
+
+
+def test_interrupted_flow_merging(chunker: SemanticChunker) -> None:
     """
     Edge Case: "Interrupted Flow"
     Scenario: A Table followed by a "Note" (Narrative) followed by another Table,
@@ -21,7 +30,6 @@ def test_interrupted_flow_merging() -> None:
     Expectation: They should ALL be merged into a single RefinedChunk because
                  there is no intervening HEADER to trigger a flush.
     """
-    chunker = SemanticChunker(IngestionConfig())
     elements = [
         ParsedElement(text="# Data Section", type="HEADER", metadata={"section_depth": 1}),
         ParsedElement(text="| A | B |", type="TABLE", metadata={}),
@@ -42,17 +50,17 @@ def test_interrupted_flow_merging() -> None:
     assert "| A | B |" in content
     assert "Note: Values are approximate." in content
     assert "| C | D |" in content
-    # Order Check
-    assert content.index("| A | B |") < content.index("Note:") < content.index("| C | D |")
+    # Order Check: one left-to-right scan over all three needles
+    ordered = re.compile(r"\| A \| B \||Note:|\| C \| D \|")
+    assert [m.group() for m in ordered.finditer(content)] == ["| A | B |", "Note:", "| C | D |"]
 
 
-def test_table_speaker_notes() -> None:
+def test_table_speaker_notes(chunker: SemanticChunker) -> None:
     """
     Edge Case: "Speaker Notes on Tables"
     Scenario: A Table element coming from a PPTX might have speaker notes attached.
     Expectation: The notes are prepended to the table content within the chunk.
     """
-    chunker = SemanticChunker(IngestionConfig())
     elements = [
         ParsedElement(text="# Slide 1", type="HEADER", metadata={"section_depth": 1}),
         ParsedElement(text="| Q1 | Q2 |", type="TABLE", metadata={"speaker_notes": "Emphasize Q2 growth."}),
@@ -65,11 +73,12 @@ def test_table_speaker_notes() -> None:
 
     assert "Speaker Notes: Emphasize Q2 growth." in content
     assert "| Q1 | Q2 |" in content
-    # Notes typically prepended
-    assert content.index("Speaker Notes:") < content.index("| Q1 | Q2 |")
+    # Notes typically prepended; single-pass ordering check
+    ordered = re.compile(r"Speaker Notes:|\| Q1 \| Q2 \|")
+    assert [m.group() for m in ordered.finditer(content)] == ["Speaker Notes:", "| Q1 | Q2 |"]
 
 
-def test_hierarchy_skipping_complex() -> None:
+def test_hierarchy_skipping_complex(chunker: SemanticChunker) -> None:
     """
     Edge Case: "Hierarchy Skipping"
     Scenario: Jumping from H1 -> H3 -> H2.
@@ -78,7 +87,6 @@ def test_hierarchy_skipping_complex() -> None:
         - H3 pushes to stack (H1 > H3).
         - H2 should pop H3 (since 2 < 3) and append H2 (Result: H1 > H2).
     """
-    chunker = SemanticChunker(IngestionConfig())
     elements = [
         ParsedElement(text="# Root", type="TITLE", metadata={}),
         # 1. H1
@@ -97,16 +105,16 @@ def test_hierarchy_skipping_complex() -> None:
     # Expect 3 chunks (one for each content block)
     assert len(chunks) == 3
 
-    # Chunk 0 (Content 1): Context: Root > Level 1
+    # Chunk 0 (Content 1): Root > Level 1
     assert "Content 1" in chunks[0].text
-    assert "Context: Root > Level 1" in chunks[0].text
+    assert chunks[0].metadata["header_hierarchy"] == ("Root", "Level 1")
 
-    # Chunk 1 (Content 3): Context: Root > Level 1 > Level 3
+    # Chunk 1 (Content 3): Root > Level 1 > Level 3
     assert "Content 3" in chunks[1].text
-    assert "Context: Root > Level 1 > Level 3" in chunks[1].text
+    assert chunks[1].metadata["header_hierarchy"] == ("Root", "Level 1", "Level 3")
 
-    # Chunk 2 (Content 2): Context: Root > Level 1 > Level 2
+    # Chunk 2 (Content 2): Root > Level 1 > Level 2
     # Logic: H2 (depth 2) is shallower than H3 (depth 3), so H3 pops.
     #        H2 (depth 2) is deeper than H1 (depth 1), so H1 stays.
     assert "Content 2" in chunks[2].text
-    assert "Context: Root > Level 1 > Level 2" in chunks[2].text
+    assert chunks[2].metadata["header_hierarchy"] == ("Root", "Level 1", "Level 2")
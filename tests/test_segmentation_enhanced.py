@@ -15,44 +15,15 @@ from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chunker() -> SemanticChunker:
     config = IngestionConfig(chunk_strategy="HEADER", segment_len=500)
     return SemanticChunker(config)
 
 
-def test_depth_inference(chunker: SemanticChunker) -> None:
-    """Test that header depth is inferred from numbering if metadata is missing."""
-    elements = [
-        ParsedElement(text="Root", type="TITLE", metadata={}),
-        # "1. Section" -> Depth 1
-        ParsedElement(text="1. Section A", type="HEADER", metadata={}),
-        # "1.1 Subsection" -> Depth 2
-        ParsedElement(text="1.1 Subsection B", type="HEADER", metadata={}),
-        # "1.1.1 Detail" -> Depth 3
-        ParsedElement(text="1.1.1 Detail C", type="HEADER", metadata={}),
-        ParsedElement(text="Content", type="NARRATIVE_TEXT", metadata={}),
-        # "2. Section D" -> Depth 1 (should pop back to root)
-        ParsedElement(text="2. Section D", type="HEADER", metadata={}),
-        ParsedElement(text="More Content", type="NARRATIVE_TEXT", metadata={}),
-    ]
-
-    chunks = chunker.chunk(elements)
-
-    assert len(chunks) == 2
-
-    # Chunk 1: Root > 1. Section A > 1.1 Subsection B > 1.1.1 Detail C
-    assert chunks[0].metadata["header_hierarchy"] == [
-        "Root",
-        "1. Section A",
-        "1.1 Subsection B",
-        "1.1.1 Detail C",
-    ]
-    assert "Content" in chunks[0].text
-
-    # Chunk 2: Root > 2. Section D
-    assert chunks[1].metadata["header_hierarchy"] == ["Root", "2. Section D"]
-    assert "More Content" in chunks[1].text
+# Plain hierarchy-equality cases (the old test_depth_inference,
+# test_hierarchy_recovery and test_section_named_header_inference) live in
+# test_segmentation_hierarchy_cases.py as parametrized data.
 
 
 def test_speaker_notes_injection(chunker: SemanticChunker) -> None:
@@ -103,19 +74,31 @@ def test_metadata_aggregation(chunker: SemanticChunker) -> None:
     assert "header_hierarchy" in chunks[0].metadata
 
 
-def test_depth_inference_edge_cases(chunker: SemanticChunker) -> None:
-    """Test edge cases for depth inference."""
-    # No number -> Default 1
-    assert chunker._infer_depth("Introduction") == 1
-
-    # "1." -> 1
-    assert chunker._infer_depth("1. Introduction") == 1
-
-    # "1.2.3.4" -> 4
-    assert chunker._infer_depth("1.2.3.4 Deep") == 4
-
-    # "Appendix A" -> 1 (Non-numeric)
-    assert chunker._infer_depth("Appendix A") == 1
+# Depth-inference edge cases, one table for all patterns:
+# - date-like "2023.01.01" counts dots (depth 3), semantically debatable
+#   but exactly what the numbering logic promises
+# - "1) Item" has no dot numbering, so it falls back to depth 1
+# - alphanumerics need a dot to match ("A. Introduction" falls back)
+DEPTH_CASES = (
+    ("Introduction", 1),
+    ("1. Introduction", 1),
+    ("1.2.3.4 Deep", 4),
+    ("Appendix A", 1),
+    ("2023.01.01 Review", 3),
+    ("10.5 kg limit", 2),
+    ("1) Item", 1),
+    (" 1.2 Title", 2),
+    ("Section 1.2", 2),
+    ("Chapter 3.1.1", 3),
+    ("A. Introduction", 1),
+    ("A.1 Subsection", 2),
+)
+
+
+@pytest.mark.parametrize("text,expected", DEPTH_CASES)
+def test_depth_inference_edge_cases(chunker: SemanticChunker, text: str, expected: int) -> None:
+    """Test edge cases for depth inference, table-driven."""
+    assert chunker._infer_depth(text) == expected
 
 
 def test_mixed_depth_sources(chunker: SemanticChunker) -> None:
@@ -135,33 +118,7 @@ def test_mixed_depth_sources(chunker: SemanticChunker) -> None:
 
     assert len(chunks) == 1
     hierarchy = chunks[0].metadata["header_hierarchy"]
-    assert hierarchy == ["Root", "Explicit 1", "1.1 Inferred", "Explicit 3"]
-
-
-def test_header_regex_edge_cases(chunker: SemanticChunker) -> None:
-    """Test _infer_depth with ambiguous inputs."""
-    # Date-like header: "2023.01.01 Review"
-    # Matches \d+(\.\d+)* -> "2023.01.01" -> 2 dots -> depth 3.
-    # This is "correct" for the regex logic, even if semantically debatable.
-    assert chunker._infer_depth("2023.01.01 Review") == 3
-
-    # Quantity-like: "10.5 kg limit"
-    # Matches "10.5" -> 1 dot -> depth 2.
-    assert chunker._infer_depth("10.5 kg limit") == 2
-
-    # Bullet-like? "1) Item" -> No match for ^\d+(\.\d+)* (unless we loosen regex)
-    # The current regex expects dot separators.
-    assert chunker._infer_depth("1) Item") == 1
-
-    # Leading whitespace? " 1.2 Title"
-    # Updated expectation: The new regex allows leading whitespace \s*
-    assert chunker._infer_depth(" 1.2 Title") == 2
-
-    # "Section 1.2"
-    assert chunker._infer_depth("Section 1.2") == 2
-
-    # "Chapter 3.1.1"
-    assert chunker._infer_depth("Chapter 3.1.1") == 3
+    assert hierarchy == ("Root", "Explicit 1", "1.1 Inferred", "Explicit 3")
 
 
 def test_disjoint_page_numbers(chunker: SemanticChunker) -> None:
@@ -180,53 +137,6 @@ def test_disjoint_page_numbers(chunker: SemanticChunker) -> None:
     assert chunks[0].metadata["page_numbers"] == [1, 5, 10]
 
 
-def test_hierarchy_recovery(chunker: SemanticChunker) -> None:
-    """Test deep nesting popping back to shallow."""
-    elements = [
-        ParsedElement(text="Root", type="TITLE", metadata={}),
-        ParsedElement(text="1", type="HEADER", metadata={"section_depth": 1}),
-        ParsedElement(text="1.1", type="HEADER", metadata={"section_depth": 2}),
-        ParsedElement(text="1.1.1", type="HEADER", metadata={"section_depth": 3}),
-        ParsedElement(text="Deep Content", type="NARRATIVE_TEXT", metadata={}),
-        # Pop back to 1
-        ParsedElement(text="2", type="HEADER", metadata={"section_depth": 1}),
-        ParsedElement(text="Shallow Content", type="NARRATIVE_TEXT", metadata={}),
-    ]
-
-    chunks = chunker.chunk(elements)
-
-    assert len(chunks) == 2
-
-    # Chunk 1: Root > 1 > 1.1 > 1.1.1
-    assert chunks[0].metadata["header_hierarchy"] == ["Root", "1", "1.1", "1.1.1"]
-
-    # Chunk 2: Root > 2
-    assert chunks[1].metadata["header_hierarchy"] == ["Root", "2"]
-
-
-def test_section_named_header_inference(chunker: SemanticChunker) -> None:
-    """Test that headers like 'Section 1.1' are correctly inferred as depth 2."""
-    elements = [
-        ParsedElement(text="Protocol", type="TITLE"),
-        ParsedElement(text="Section 1: Overview", type="HEADER"),
-        ParsedElement(text="Content 1", type="NARRATIVE_TEXT"),
-        ParsedElement(text="Section 1.1: Details", type="HEADER"),
-        ParsedElement(text="Content 1.1", type="NARRATIVE_TEXT"),
-    ]
-
-    chunks = chunker.chunk(elements)
-
-    assert len(chunks) == 2
-
-    # Chunk 0: Section 1
-    # Expect: Protocol > Section 1
-    assert chunks[0].metadata["header_hierarchy"] == ["Protocol", "Section 1: Overview"]
-
-    # Chunk 1: Section 1.1
-    # Expect: Protocol > Section 1 > Section 1.1
-    assert chunks[1].metadata["header_hierarchy"] == ["Protocol", "Section 1: Overview", "Section 1.1: Details"]
-
-
 def test_markdown_mixed_with_numbering(chunker: SemanticChunker) -> None:
     """Test that markdown takes precedence, but if absent, numbering works."""
     elements = [
@@ -238,4 +148,4 @@ def test_markdown_mixed_with_numbering(chunker: SemanticChunker) -> None:
 
     chunks = chunker.chunk(elements)
     # The header cleaner strips leading hashes, so "# Top Level" becomes "Top Level"
-    assert chunks[0].metadata["header_hierarchy"] == ["Doc", "Top Level", "1.1 Sub"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Doc", "Top Level", "1.1 Sub")
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_refinery
+
+import pytest
+
+from coreason_refinery.models import IngestionConfig
+from coreason_refinery.parsing import ParsedElement
+from coreason_refinery.segmentation import SemanticChunker
+
+
+@pytest.fixture(scope="module")
+def chunker() -> SemanticChunker:
+    config = IngestionConfig()
+    return SemanticChunker(config)
+
+
+# End-to-end hierarchy cases: each entry is (id, elements, expected hierarchy
+# per chunk). Collection-time fanout lets pytest-xdist spread them across
+# workers, and one data table beats four near-identical test bodies.
+HIERARCHY_CASES = [
+    (
+        "markdown_header_depth",
+        [
+            ParsedElement(text="# Title", type="TITLE"),
+            ParsedElement(text="# Section 1", type="HEADER"),
+            ParsedElement(text="Content 1", type="NARRATIVE_TEXT"),
+            ParsedElement(text="## Subsection 1.1", type="HEADER"),
+            ParsedElement(text="Content 1.1", type="NARRATIVE_TEXT"),
+            ParsedElement(text="### Detail 1.1.1", type="HEADER"),
+            ParsedElement(text="Content 1.1.1", type="NARRATIVE_TEXT"),
+            ParsedElement(text="# Section 2", type="HEADER"),
+            ParsedElement(text="Content 2", type="NARRATIVE_TEXT"),
+        ],
+        [
+            ["Title", "Section 1"],
+            ["Title", "Section 1", "Subsection 1.1"],
+            ["Title", "Section 1", "Subsection 1.1", "Detail 1.1.1"],
+            ["Title", "Section 2"],
+        ],
+    ),
+    (
+        "depth_inference",
+        [
+            ParsedElement(text="Root", type="TITLE", metadata={}),
+            ParsedElement(text="1. Section A", type="HEADER", metadata={}),
+            ParsedElement(text="1.1 Subsection B", type="HEADER", metadata={}),
+            ParsedElement(text="1.1.1 Detail C", type="HEADER", metadata={}),
+            ParsedElement(text="Content", type="NARRATIVE_TEXT", metadata={}),
+            # "2. Section D" -> Depth 1 (should pop back to root)
+            ParsedElement(text="2. Section D", type="HEADER", metadata={}),
+            ParsedElement(text="More Content", type="NARRATIVE_TEXT", metadata={}),
+        ],
+        [
+            ["Root", "1. Section A", "1.1 Subsection B", "1.1.1 Detail C"],
+            ["Root", "2. Section D"],
+        ],
+    ),
+    (
+        "hierarchy_recovery",
+        [
+            ParsedElement(text="Root", type="TITLE", metadata={}),
+            ParsedElement(text="1", type="HEADER", metadata={"section_depth": 1}),
+            ParsedElement(text="1.1", type="HEADER", metadata={"section_depth": 2}),
+            ParsedElement(text="1.1.1", type="HEADER", metadata={"section_depth": 3}),
+            ParsedElement(text="Deep Content", type="NARRATIVE_TEXT", metadata={}),
+            # Pop back to 1
+            ParsedElement(text="2", type="HEADER", metadata={"section_depth": 1}),
+            ParsedElement(text="Shallow Content", type="NARRATIVE_TEXT", metadata={}),
+        ],
+        [
+            ["Root", "1", "1.1", "1.1.1"],
+            ["Root", "2"],
+        ],
+    ),
+    (
+        "section_named_header_inference",
+        [
+            ParsedElement(text="Protocol", type="TITLE"),
+            ParsedElement(text="Section 1: Overview", type="HEADER"),
+            ParsedElement(text="Content 1", type="NARRATIVE_TEXT"),
+            # "Section 1.1" is correctly inferred as depth 2
+            ParsedElement(text="Section 1.1: Details", type="HEADER"),
+            ParsedElement(text="Content 1.1", type="NARRATIVE_TEXT"),
+        ],
+        [
+            ["Protocol", "Section 1: Overview"],
+            ["Protocol", "Section 1: Overview", "Section 1.1: Details"],
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("name,elements,expected", HIERARCHY_CASES, ids=[c[0] for c in HIERARCHY_CASES])
+def test_hierarchy(
+    chunker: SemanticChunker,
+    name: str,
+    elements: list[ParsedElement],
+    expected: list[list[str]],
+) -> None:
+    """Chunk the elements and compare every chunk's header hierarchy."""
+    chunks = chunker.chunk(elements)
+    assert [list(c.metadata["header_hierarchy"]) for c in chunks] == expected
@@ -15,7 +15,7 @@ from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chunker() -> SemanticChunker:
     config = IngestionConfig()
     return SemanticChunker(config)
@@ -23,10 +23,11 @@ def chunker() -> SemanticChunker:
 
 def test_unicode_and_special_characters(chunker: SemanticChunker) -> None:
     """Test handling of headers with Unicode and special characters."""
+    # Explicit escapes keep the literals immune to source mis-encoding.
     elements = [
-        ParsedElement(text="# Project 🚀 Omega", type="TITLE"),
+        ParsedElement(text="# Project \N{ROCKET} Omega", type="TITLE"),
         ParsedElement(text="## Section 1: 日本語", type="HEADER"),
-        ParsedElement(text="Content with emojis 😃.", type="NARRATIVE_TEXT"),
+        ParsedElement(text="Content with emojis \N{SMILING FACE WITH OPEN MOUTH}.", type="NARRATIVE_TEXT"),
         ParsedElement(text="## Section 2: <Tags>", type="HEADER"),
         ParsedElement(text="Content with tags.", type="NARRATIVE_TEXT"),
     ]
@@ -37,12 +38,13 @@ def test_unicode_and_special_characters(chunker: SemanticChunker) -> None:
     assert len(chunks) == 2
 
     # Chunk 1
-    # Cleaned headers should have hashes removed.
-    assert "Context: Project 🚀 Omega > Section 1: 日本語" in chunks[0].text
-    assert "Content with emojis 😃." in chunks[0].text
+    # Cleaned headers should have hashes removed. This one keeps a rendered
+    # "Context:" check as the smoke test for the breadcrumb renderer.
+    assert "Context: Project \N{ROCKET} Omega > Section 1: 日本語" in chunks[0].text
+    assert "Content with emojis \N{SMILING FACE WITH OPEN MOUTH}." in chunks[0].text
 
-    # Chunk 2
-    assert "Context: Project 🚀 Omega > Section 2: <Tags>" in chunks[1].text
+    # Chunk 2: structural check against the stored hierarchy
+    assert chunks[1].metadata["header_hierarchy"] == ("Project \N{ROCKET} Omega", "Section 2: <Tags>")
 
 
 def test_markdown_variations_and_whitespace(chunker: SemanticChunker) -> None:
@@ -66,7 +68,7 @@ def test_markdown_variations_and_whitespace(chunker: SemanticChunker) -> None:
     # The current regex `re.sub(r"^\s*#+\s*", "", text).strip()`
     # Let's verify expectation: "Clean Header ##"
 
-    assert chunks[0].metadata["header_hierarchy"] == ["Messy Header", "Clean Header ##"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Messy Header", "Clean Header ##")
 
 
 def test_missing_optional_metadata(chunker: SemanticChunker) -> None:
@@ -81,32 +83,30 @@ def test_missing_optional_metadata(chunker: SemanticChunker) -> None:
 
     assert len(chunks) == 1
     assert chunks[0].text.endswith("Content")
-    assert chunks[0].metadata["header_hierarchy"] == ["Title", "Header"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Title", "Header")
     # Should not crash looking for keys
 
 
-def test_header_depth_extremes(chunker: SemanticChunker) -> None:
-    """Test very deep nesting."""
-    elements = [ParsedElement(text="Root", type="TITLE")]
+@pytest.fixture(scope="session")
+def deep_nesting_elements() -> list[ParsedElement]:
+    """Constant input for test_header_depth_extremes, built once per session."""
+    # Headers with hash counts 1 to 10, built in one comprehension
+    return (
+        [ParsedElement(text="Root", type="TITLE")]
+        + [ParsedElement(text=f"{'#' * i} Level {i}", type="HEADER") for i in range(1, 11)]
+        + [ParsedElement(text="Deep Content", type="NARRATIVE_TEXT")]
+    )
 
-    # Create depth 1 to 10
-    expected_hierarchy = ["Root"]
-    for i in range(1, 11):
-        hashes = "#" * i
-        text = f"{hashes} Level {i}"
-        elements.append(ParsedElement(text=text, type="HEADER"))
-        # Expect cleaned text in hierarchy
-        expected_hierarchy.append(f"Level {i}")
 
-    elements.append(ParsedElement(text="Deep Content", type="NARRATIVE_TEXT"))
+def test_header_depth_extremes(chunker: SemanticChunker, deep_nesting_elements: list[ParsedElement]) -> None:
+    """Test very deep nesting (10 levels)."""
+    chunks = chunker.chunk(deep_nesting_elements)
 
-    chunks = chunker.chunk(elements)
+    # Expected hierarchy for the deep content: Root > Level 1 > ... > Level 10
+    expected_hierarchy = ("Root",) + tuple(f"Level {i}" for i in range(1, 11))
 
     assert len(chunks) == 1
     assert chunks[0].metadata["header_hierarchy"] == expected_hierarchy
-    # Check that context string is constructed without error for long chain
-    # Cleaned context expectation:
-    assert "Context: Root > Level 1 > Level 2" in chunks[0].text
 
 
 def test_alphanumeric_inference_robustness(chunker: SemanticChunker) -> None:
@@ -130,7 +130,7 @@ def test_alphanumeric_inference_robustness(chunker: SemanticChunker) -> None:
 
     # Chunk 1: A.1
     # Stack: Doc -> A. -> A.1
-    assert chunks[0].metadata["header_hierarchy"] == ["Doc", "A. Introduction", "A.1 Subsection"]
+    assert chunks[0].metadata["header_hierarchy"] == ("Doc", "A. Introduction", "A.1 Subsection")
 
     # Chunk 2: B.
     # Stack: Doc -> B.
@@ -151,4 +151,4 @@ def test_alphanumeric_inference_robustness(chunker: SemanticChunker) -> None:
     # Next Stack Top: "Doc" (Depth 0).
     # 1 > 0. Push "B.".
 
-    assert chunks[1].metadata["header_hierarchy"] == ["Doc", "B. Next Section"]
+    assert chunks[1].metadata["header_hierarchy"] == ("Doc", "B. Next Section")
@@ -8,11 +8,56 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
+import re
+from functools import lru_cache
+from typing import Literal
+
 from coreason_refinery.models import IngestionConfig
 from coreason_refinery.parsing import ParsedElement
 from coreason_refinery.segmentation import SemanticChunker
 
 
+@lru_cache(maxsize=8)
+def _get_chunker(strategy: Literal["HEADER", "SIZE"] = "HEADER", segment_len: int = 500) -> SemanticChunker:
+    """Memoized chunker factory: one instance per distinct config."""
+    return SemanticChunker(IngestionConfig(chunk_strategy=strategy, segment_len=segment_len))
+
+
+# Story A input, built once at import: a large table split across multiple
+# elements (simulating pages), total length well over segment_len=100.
+_ROW_PART_1 = "| Dose | Response |\n| --- | --- |\n" + ("| 10mg | Good |\n" * 5)  # ~80 chars
+_ROW_PART_2 = "| 20mg | Better |\n" * 5  # ~80 chars
+_ROW_PART_3 = "| 30mg | Best |\n" * 5  # ~80 chars
+
+_STORY_A_ELEMENTS = (
+    ParsedElement(text="# Protocol 999", type="TITLE", metadata={"page_number": 1}),
+    ParsedElement(text="## Section 4: Toxicity", type="HEADER", metadata={"page_number": 1, "section_depth": 2}),
+    # Table starts on page 1
+    ParsedElement(text=_ROW_PART_1, type="TABLE", metadata={"page_number": 1, "is_table": True}),
+    # Table continues on page 2 (no intervening header)
+    ParsedElement(text=_ROW_PART_2, type="TABLE", metadata={"page_number": 2, "is_table": True}),
+    # Table continues on page 3
+    ParsedElement(text=_ROW_PART_3, type="TABLE", metadata={"page_number": 3, "is_table": True}),
+    # Next section
+    ParsedElement(text="## Section 5: Conclusion", type="HEADER", metadata={"page_number": 3, "section_depth": 2}),
+    # Add content to section 5 so it becomes a chunk
+    ParsedElement(text="The study is concluded.", type="NARRATIVE_TEXT", metadata={"page_number": 3}),
+)
+
+# Ordered containment in one pass over the chunk text: cleaned breadcrumb
+# first, then the three table parts in page order.
+_STORY_A_PATTERN = re.compile(
+    re.escape("Context: Protocol 999 > Section 4: Toxicity")
+    + r".*?"
+    + re.escape(_ROW_PART_1)
+    + r".*?"
+    + re.escape(_ROW_PART_2)
+    + r".*?"
+    + re.escape(_ROW_PART_3),
+    re.DOTALL,
+)
+
+
 def test_story_a_table_rescue_large_table() -> None:
     """
     Story A: The "Table Rescue" (Structure Preservation)
@@ -21,31 +66,9 @@ def test_story_a_table_rescue_large_table() -> None:
     Constraint Check: Ensure table is NOT split even if it exceeds segment_len (e.g. 500 chars).
     """
     # Config with a small segment length to trigger potential splitting if it were implemented naively
-    config = IngestionConfig(chunk_strategy="HEADER", segment_len=100)
-    chunker = SemanticChunker(config)
+    chunker = _get_chunker("HEADER", segment_len=100)
 
-    # Create a large table split across multiple elements (simulating pages)
-    # Total length > 100 chars
-    row_part_1 = "| Dose | Response |\n| --- | --- |\n" + ("| 10mg | Good |\n" * 5)  # ~80 chars
-    row_part_2 = "| 20mg | Better |\n" * 5  # ~80 chars
-    row_part_3 = "| 30mg | Best |\n" * 5  # ~80 chars
-
-    elements = [
-        ParsedElement(text="# Protocol 999", type="TITLE", metadata={"page_number": 1}),
-        ParsedElement(text="## Section 4: Toxicity", type="HEADER", metadata={"page_number": 1, "section_depth": 2}),
-        # Table starts on page 1
-        ParsedElement(text=row_part_1, type="TABLE", metadata={"page_number": 1, "is_table": True}),
-        # Table continues on page 2 (no intervening header)
-        ParsedElement(text=row_part_2, type="TABLE", metadata={"page_number": 2, "is_table": True}),
-        # Table continues on page 3
-        ParsedElement(text=row_part_3, type="TABLE", metadata={"page_number": 3, "is_table": True}),
-        # Next section
-        ParsedElement(text="## Section 5: Conclusion", type="HEADER", metadata={"page_number": 3, "section_depth": 2}),
-        # Add content to section 5 so it becomes a chunk
-        ParsedElement(text="The study is concluded.", type="NARRATIVE_TEXT", metadata={"page_number": 3}),
-    ]
-
-    chunks = chunker.chunk(elements)
+    chunks = chunker.chunk(list(_STORY_A_ELEMENTS))
 
     # Expectations:
     # Chunk 0: Protocol 999 (Title) -> No content, so NO chunk.
@@ -60,13 +83,9 @@ def test_story_a_table_rescue_large_table() -> None:
     # Check Chunk 0 (The Table)
     table_chunk = chunks[0]
 
-    # Verify Content Merging
-    assert row_part_1 in table_chunk.text
-    assert row_part_2 in table_chunk.text
-    assert row_part_3 in table_chunk.text
-
-    # Verify Context (Story B check implicitly) - Cleaned Headers!
-    assert "Context: Protocol 999 > Section 4: Toxicity" in table_chunk.text
+    # Verify content merging and the cleaned context breadcrumb (Story B
+    # check implicitly) with a single scan
+    assert _STORY_A_PATTERN.search(table_chunk.text)
 
     # Verify Metadata Aggregation (Page numbers)
     assert "page_numbers" in table_chunk.metadata
@@ -79,8 +98,7 @@ def test_story_b_header_context_breadcrumbs() -> None:
     Context: A chunk simply says: "Stop treatment immediately."
     Action: Refinery prepends the hierarchy: Context: [Protocol 999] > [Section 4: Toxicity] > [Grade 4 Events].
     """
-    config = IngestionConfig()
-    chunker = SemanticChunker(config)
+    chunker = _get_chunker()
 
     elements = [
         ParsedElement(text="Protocol 999", type="TITLE", metadata={}),
@@ -108,13 +126,12 @@ def test_single_large_table_atomicity() -> None:
     """
     # Set segment_len to be very small
     segment_len = 50
-    config = IngestionConfig(chunk_strategy="HEADER", segment_len=segment_len)
-    chunker = SemanticChunker(config)
+    chunker = _get_chunker("HEADER", segment_len=segment_len)
 
-    # Create a large table text significantly larger than segment_len
-    large_table_text = "| Col1 | Col2 |\n| --- | --- |\n"
-    for i in range(20):
-        large_table_text += f"| Row {i} | Data {i} |\n"
+    # Create a large table text significantly larger than segment_len;
+    # a single join keeps this linear if the row count is ever scaled up
+    rows = "\n".join(f"| Row {i} | Data {i} |" for i in range(20))
+    large_table_text = "| Col1 | Col2 |\n| --- | --- |\n" + rows + "\n"
 
     # Verify we created a large enough string
     assert len(large_table_text) > segment_len * 2
@@ -141,8 +158,8 @@ def test_segmentation_enforces_length_on_narrative() -> None:
     Verify that the chunker respects segment_len by splitting a sequence of elements
     that exceeds the length limit.
     """
-    config = IngestionConfig(chunk_strategy="HEADER", segment_len=100)
-    chunker = SemanticChunker(config)
+    # Same config as the table-rescue story, so the memoized instance is shared
+    chunker = _get_chunker("HEADER", segment_len=100)
 
     # Create multiple small narrative elements that sum up to > segment_len
     # "word " is 5 chars. 25 words = 125 chars > 100.
@@ -160,4 +177,4 @@ def test_segmentation_enforces_length_on_narrative() -> None:
     # Expectation:
     # Logic should flush buffer when it gets full.
     # We should have more than 1 chunk (Section 1 context).
-    assert len(chunks) > 1, f"Expected > 1 chunk for aggregated text > {config.segment_len}, got {len(chunks)}."
+    assert len(chunks) > 1, f"Expected > 1 chunk for aggregated text > {chunker.config.segment_len}, got {len(chunks)}."
@@ -8,6 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_refinery
 
+import uuid
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,51 +16,104 @@ import pytest
 from fastapi.testclient import TestClient
 
 from coreason_refinery.models import RefinedChunk
-from coreason_refinery.server import app
+from coreason_refinery.server import app, get_job_id, get_pipeline
 
+# Shared upload payload, multipart-encoded once at import so each request
+# posts prebuilt bytes instead of re-running the multipart encoder.
+_BOUNDARY = "refinery-test-boundary"
+INGEST_BODY = (
+    f"--{_BOUNDARY}\r\n"
+    'Content-Disposition: form-data; name="file"; filename="test.txt"\r\n'
+    "Content-Type: text/plain\r\n"
+    "\r\n"
+    "content\r\n"
+    f"--{_BOUNDARY}--\r\n"
+).encode()
+INGEST_HEADERS = {"Content-Type": f"multipart/form-data; boundary={_BOUNDARY}"}
 
-@pytest.fixture
-def mock_pipeline() -> Generator[MagicMock, None, None]:
-    with patch("coreason_refinery.server.RefineryPipelineAsync") as MockPipeline:
-        pipeline_instance = MockPipeline.return_value
-        pipeline_instance.__aenter__ = AsyncMock(return_value=pipeline_instance)
-        pipeline_instance.__aexit__ = AsyncMock(return_value=None)
-        pipeline_instance.process = AsyncMock(return_value=[RefinedChunk(id="1", text="test", vector=[], metadata={})])
-        yield pipeline_instance
 
+@pytest.fixture(scope="module")
+def mock_pipeline() -> MagicMock:
+    pipeline = MagicMock()
+    pipeline.process = AsyncMock()
+    return pipeline
 
-def test_ingest_endpoint(mock_pipeline: MagicMock) -> None:
-    with TestClient(app) as client:
-        response = client.post("/ingest", files={"file": ("test.txt", b"content", "text/plain")})
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["text"] == "test"
 
-        # Verify process was called
-        assert mock_pipeline.process.called
+@pytest.fixture(autouse=True)
+def _reset_pipeline(mock_pipeline: MagicMock) -> Generator[None, None, None]:
+    # One AsyncMock for the module; wipe configuration between tests so each
+    # one only sets the return_value/side_effect it needs.
+    yield
+    mock_pipeline.process.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def client(mock_pipeline: MagicMock) -> Generator[TestClient, None, None]:
+    # One TestClient for the whole module: the lifespan runs once, against a
+    # patched pipeline class so no real pipeline (or HTTP client) is ever
+    # constructed. Requests resolve the mock through the dependency override
+    # rather than app.state.
+    app.dependency_overrides[get_pipeline] = lambda: mock_pipeline
+    lifespan_pipeline = AsyncMock()
+    lifespan_pipeline.__aenter__.return_value = lifespan_pipeline
+    with patch("coreason_refinery.server.RefineryPipelineAsync", return_value=lifespan_pipeline):
+        with TestClient(app) as test_client:
+            yield test_client
+    app.dependency_overrides.clear()
+
+
+def test_get_pipeline_reads_app_state() -> None:
+    request = MagicMock()
+    assert get_pipeline(request) is request.app.state.pipeline
+
+
+def test_ingest_endpoint(client: TestClient, mock_pipeline: MagicMock) -> None:
+    mock_pipeline.process.return_value = [RefinedChunk(id="1", text="test", vector=[], metadata={})]
+
+    response = client.post("/ingest", content=INGEST_BODY, headers=INGEST_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["text"] == "test"
 
+    # Verify process was called
+    assert mock_pipeline.process.called
 
-def test_ingest_no_file() -> None:
-    with TestClient(app) as client:
-        response = client.post("/ingest")
-        assert response.status_code == 422
 
+def test_ingest_deterministic_job_id(client: TestClient, mock_pipeline: MagicMock) -> None:
+    mock_pipeline.process.return_value = []
 
-def test_ingest_error(mock_pipeline: MagicMock) -> None:
+    # Overriding get_job_id pins the job id without patching uuid.uuid4
+    job_id = uuid.UUID("00000000-0000-0000-0000-000000000042")
+    app.dependency_overrides[get_job_id] = lambda: job_id
+    try:
+        response = client.post("/ingest", content=INGEST_BODY, headers=INGEST_HEADERS)
+    finally:
+        del app.dependency_overrides[get_job_id]
+
+    assert response.status_code == 200
+    job = mock_pipeline.process.call_args.args[0]
+    assert job.id == job_id
+
+
+def test_ingest_no_file(client: TestClient) -> None:
+    response = client.post("/ingest")
+    assert response.status_code == 422
+
+
+def test_ingest_error(client: TestClient, mock_pipeline: MagicMock) -> None:
     mock_pipeline.process.side_effect = RuntimeError("Processing failed")
-    with TestClient(app) as client:
-        # FastAPI TestClient re-raises exceptions from the app
-        with pytest.raises(RuntimeError, match="Processing failed"):
-            client.post("/ingest", files={"file": ("test.txt", b"content", "text/plain")})
+
+    # FastAPI TestClient re-raises exceptions from the app
+    with pytest.raises(RuntimeError, match="Processing failed"):
+        client.post("/ingest", content=INGEST_BODY, headers=INGEST_HEADERS)
 
 
-def test_ingest_cleanup_error(mock_pipeline: MagicMock) -> None:
+def test_ingest_cleanup_error(client: TestClient, mock_pipeline: MagicMock) -> None:
+    mock_pipeline.process.return_value = [RefinedChunk(id="1", text="test", vector=[], metadata={})]
+
     # We need to simulate the file existing so cleanup tries to remove it
     # Then make remove fail
-    with TestClient(app) as client:
-        # We need to patch os.remove to raise exception
-        # We assume tempfile creation works fine
-        with patch("coreason_refinery.server.os.remove", side_effect=OSError("Permission denied")):
-            response = client.post("/ingest", files={"file": ("test.txt", b"content", "text/plain")})
-            assert response.status_code == 200
+    with patch("coreason_refinery.server.os.remove", side_effect=OSError("Permission denied")):
+        response = client.post("/ingest", content=INGEST_BODY, headers=INGEST_HEADERS)
+        assert response.status_code == 200